@@ -4,7 +4,6 @@ import json
 from pathlib import Path
 
 import click
-from rich.table import Table
 
 from ..services.rst_link_checker import RSTLinkChecker
 from .cli import cli
@@ -89,6 +88,8 @@ def check_links(  # noqa: PLR0913
         click.echo(json.dumps(data, indent=2))
     else:
         # Pretty table with rich (for table and text formats)
+        from rich.table import Table
+
         table = Table(title="Broken RST Links")
         table.add_column("File")
         table.add_column("Line")
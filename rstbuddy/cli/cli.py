@@ -1,17 +1,25 @@
 from __future__ import annotations  # noqa: I001
 
+import functools
 import json
 import os
+import shutil
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.table import Table
 
 from ..settings import Settings
 from .utils import console, create_progress, print_error, print_info, print_success
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rich.progress import Progress
+
 
 def print_header(msg: str) -> None:
     """Print header message."""
@@ -23,8 +31,42 @@ def print_warning(msg: str) -> None:
     console.print(f"[yellow]⚠[/yellow] Warning: {msg}")
 
 
+@dataclass(frozen=True, slots=True)
+class _Utils:
+    """
+    Namespace of output helpers handed to commands as ``ctx.obj["utils"]``.
+
+    This is built once at import time as :data:`_UTILS` rather than on every
+    invocation of the :func:`cli` group.
+    """
+
+    print_info: Callable[[str], None]
+    print_error: Callable[..., None]
+    print_success: Callable[[str], None]
+    print_header: Callable[[str], None]
+    print_warning: Callable[[str], None]
+    show_progress: Callable[[], Progress]
+
+
+#: The shared :class:`_Utils` instance
+_UTILS = _Utils(
+    print_info=print_info,
+    print_error=print_error,
+    print_success=print_success,
+    print_header=print_header,
+    print_warning=print_warning,
+    show_progress=create_progress,
+)
+
+
+@functools.cache
 def get_package_version(package_name: str) -> str:
-    """Get package version safely."""
+    """
+    Get package version safely.
+
+    Installed package versions don't change during a process, so the result
+    is cached to avoid rescanning the ``*.dist-info`` metadata on each call.
+    """
     try:
         import importlib.metadata
 
@@ -38,6 +80,88 @@ def get_package_version(package_name: str) -> str:
             return "unknown"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_settings(environ: tuple[tuple[str, str], ...], cwd: str) -> Settings:  # noqa: ARG001
+    """
+    Build a :class:`~rstbuddy.settings.Settings` instance, memoized on its inputs.
+
+    ``Settings`` re-reads the environment and any TOML config files each time
+    it is constructed, so we cache on everything that can change the result:
+    the ``RSTBUDDY_*`` environment variables and the working directory (which
+    determines which local ``.rstbuddy.toml`` is used).  Tests that need a
+    fresh instance should call ``_load_settings.cache_clear()``.
+
+    Args:
+        environ: Sorted snapshot of the ``RSTBUDDY_*`` environment variables
+        cwd: The current working directory
+
+    Returns:
+        The loaded settings
+
+    """
+    return Settings()
+
+
+def load_settings(config_file: Path | str | None = None) -> Settings:
+    """
+    Load settings, reusing a previously built instance when nothing changed.
+
+    Args:
+        config_file: Optional explicit configuration file
+
+    Returns:
+        The loaded settings
+
+    """
+    if config_file:
+        os.environ["RSTBUDDY_CONFIG_FILE"] = str(Path(config_file).resolve())
+    environ = tuple(
+        sorted(item for item in os.environ.items() if item[0].startswith("RSTBUDDY_"))
+    )
+    return _load_settings(environ, str(Path.cwd()))
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_version_for(pandoc_path: str, mtime_ns: int) -> str:  # noqa: ARG001
+    """
+    Ask a specific ``pandoc`` binary for its version.
+
+    ``mtime_ns`` is unused here; it is part of the cache key so that upgrading
+    pandoc in place invalidates the cached answer.
+
+    Args:
+        pandoc_path: Absolute path to the ``pandoc`` executable
+        mtime_ns: Modification time of ``pandoc_path`` in nanoseconds
+
+    Returns:
+        The pandoc version string, or ``"not found"`` if pandoc could not be run
+
+    """
+    try:
+        output = subprocess.check_output([pandoc_path, "--version"])
+    except (OSError, subprocess.CalledProcessError):
+        return "not found"
+    return output.decode("utf-8").split("\n")[0].split(" ")[1]
+
+
+def _pandoc_version() -> str:
+    """
+    Get the version of the ``pandoc`` on our ``PATH``, caching the result.
+
+    Returns:
+        The pandoc version string, or ``"not found"`` if pandoc is not installed
+
+    """
+    pandoc_path = shutil.which("pandoc")
+    if pandoc_path is None:
+        return "not found"
+    try:
+        mtime_ns = os.stat(pandoc_path).st_mtime_ns  # noqa: PTH116
+    except OSError:
+        return "not found"
+    return _pandoc_version_for(pandoc_path, mtime_ns)
+
+
 @click.group()
 @click.option(
     "--quiet",
@@ -79,9 +203,7 @@ def cli(
 
     # Load configuration
     try:
-        if config_file:
-            os.environ["RSTBUDDY_CONFIG_FILE"] = str(config_file)
-        settings = Settings()
+        settings = load_settings(config_file)
         ctx.obj["settings"] = settings
     except Exception as e:
         print_error(f"Failed to load configuration: {e}")
@@ -91,16 +213,7 @@ def cli(
     ctx.obj["console"] = console
 
     # Add utils object to context for commands that need utility functions
-    class Utils:
-        def __init__(self):
-            self.print_info = print_info
-            self.print_error = print_error
-            self.print_success = print_success
-            self.print_header = print_header
-            self.print_warning = print_warning
-            self.show_progress = create_progress
-
-    ctx.obj["utils"] = Utils()
+    ctx.obj["utils"] = _UTILS
 
     # Configure console based on quiet mode
     if quiet:
@@ -119,6 +232,11 @@ def version(ctx: click.Context) -> None:
     """
     # Use context console if available, fallback to global console
     output_console = ctx.obj.get("console", console)
+    if output_console.quiet:
+        # Nothing would be printed, so don't bother gathering version info
+        return
+
+    from rich.table import Table
 
     table = Table(title="rstbuddy Version Info")
     table.add_column("Package", justify="left", style="cyan", no_wrap=True)
@@ -131,17 +249,7 @@ def version(ctx: click.Context) -> None:
     table.add_row("openai", get_package_version("openai"))
     table.add_row("mdformat", get_package_version("mdformat"))
 
-    # Get pandoc version
-    try:
-        pandoc_version = (
-            subprocess.check_output(["pandoc", "--version"])
-            .decode("utf-8")
-            .split("\n")[0]
-            .split(" ")[1]
-        )
-        table.add_row("pandoc", pandoc_version)
-    except subprocess.CalledProcessError:
-        table.add_row("pandoc", "not found")
+    table.add_row("pandoc", _pandoc_version())
 
     output_console.print(table)
 
@@ -171,32 +279,39 @@ def show_settings(ctx: click.Context, output: str | None, verbose: bool):
     )
     is_verbose = verbose or ctx.obj.get("verbose", False)
 
-    # Use settings from context if available, otherwise create new instance
-    settings = ctx.obj.get("settings")
-    if not settings:
-        # Create a fresh Settings instance to avoid test state crossover
-        # If a config file was specified, use it
-        config_file = ctx.obj.get("config_file")
+    # The cli() group always loads the settings before running a command
+    settings = ctx.obj["settings"]
 
-        if config_file:
-            os.environ["RSTBUDDY_CONFIG_FILE"] = str(config_file)
-        settings = Settings()
+    # Serialize the settings once and reuse the result below
+    dumped = settings.model_dump()
 
     if output_format == "json":
-        click.echo(json.dumps(settings.model_dump()))
+        click.echo(json.dumps(dumped))
     elif output_format == "table":
-        table = Table(title="Settings", show_header=True, header_style="bold magenta")
-        table.add_column("Setting Name", style="cyan")
-        table.add_column("Value", style="green")
+        # A quiet console would discard the table, so skip building it
+        if not output_console.quiet:
+            from rich.table import Table
+
+            table = Table(
+                title="Settings", show_header=True, header_style="bold magenta"
+            )
+            table.add_column("Setting Name", style="cyan")
+            table.add_column("Value", style="green")
 
-        for setting_name, setting_value in settings.model_dump().items():
-            table.add_row(setting_name, str(setting_value))
+            add_row = table.add_row
+            for setting_name, setting_value in dumped.items():
+                add_row(setting_name, str(setting_value))
 
-        output_console.print(table)
+            output_console.print(table)
     else:  # text format
-        for setting_name, setting_value in settings.model_dump().items():
-            click.echo(f"{setting_name}: {setting_value}")
-            click.echo()
+        # Emit all settings with a single write
+        click.echo(
+            "".join(
+                f"{setting_name}: {setting_value}\n\n"
+                for setting_name, setting_value in dumped.items()
+            ),
+            nl=False,
+        )
 
     if is_verbose:
-        print_info(f"Found {len(settings.model_dump())} settings")
+        print_info(f"Found {len(dumped)} settings")
@@ -11,7 +11,6 @@ from __future__ import annotations
 from pathlib import Path
 
 import click
-from rich.table import Table
 
 from ..services.rst_cleaner import RSTCleaner
 from .cli import cli
@@ -38,6 +37,8 @@ def fix_rst(rst_file: Path, dry_run: bool) -> None:
     cleaned_report = cleaner.clean_file(original_path, dry_run=dry_run)
 
     # Output summary using rich table
+    from rich.table import Table
+
     table = Table(title="RST Clean Summary")
     table.add_column("File")
     table.add_column("Headings")
@@ -7,16 +7,306 @@ It uses the Marko-based parser for more reliable markdown parsing.
 
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
+from .. import __version__
 from ..exc import FileError
-from ..services.marko_outline_parser import MarkoOutlineParser
-from ..services.marko_outline_converter import MarkoOutlineConverter
-from ..services.outline_validator import OutlineValidator
+from ..settings import user_cache_dir
 from .cli import cli
 
+if TYPE_CHECKING:
+    from ..models.marko_outline import MarkoBookOutline, MarkoContentBlock
+    from ..models.outline import ValidationError, ValidationResult
+
+#: Bump this whenever the cached outline format changes, so that stale cache
+#: entries are ignored.  The package version is part of the cache key as
+#: well, so this only matters between releases.
+OUTLINE_CACHE_VERSION = 5
+
+
+def _outline_cache_path(content: bytes, output_dir: Path | str) -> Path:
+    """
+    Return the cache file for a markdown file's contents and output directory.
+
+    Args:
+        content: The UTF-8 encoded text of the markdown file
+        output_dir: The output directory the outline will be built for
+
+    Returns:
+        Path to the JSON file for this input
+
+    """
+    digest = hashlib.blake2b(content)
+    digest.update(f"\0{OUTLINE_CACHE_VERSION}\0{__version__}\0{output_dir}".encode())
+    return user_cache_dir() / f"{digest.hexdigest()}.json"
+
+
+def _outline_to_json(
+    validation_result: ValidationResult, outline: MarkoBookOutline
+) -> dict[str, Any]:
+    """
+    Convert a ``(validation_result, outline)`` pair to JSON-compatible data.
+
+    Args:
+        validation_result: The result of validating the markdown file
+        outline: The parsed outline
+
+    Returns:
+        The data to save, as read back by :func:`_outline_from_json`
+
+    """
+
+    def block(block: MarkoContentBlock) -> list[Any]:
+        return [block.content, block.start_line, block.end_line]
+
+    def errors(errors: list[ValidationError]) -> list[list[Any]]:
+        return [[e.line_number, e.message, e.severity] for e in errors]
+
+    return {
+        "validation_result": {
+            "is_valid": validation_result.is_valid,
+            "errors": errors(validation_result.errors),
+            "warnings": errors(validation_result.warnings),
+        },
+        "outline": {
+            "title": outline.title,
+            "introduction_content": block(outline.introduction_content),
+            "output_dir": str(outline.output_dir),
+            "chapters": [
+                {
+                    "title": chapter.title,
+                    "heading_type": chapter.heading_type.value,
+                    "folder_name": chapter.folder_name,
+                    "content": block(chapter.content),
+                    "chapter_number": chapter.chapter_number,
+                    "appendix_letter": chapter.appendix_letter,
+                    "sections": [
+                        {
+                            "title": section.title,
+                            "number": section.number,
+                            "content": block(section.content),
+                            "filename": section.filename,
+                            "section_type": section.section_type,
+                        }
+                        for section in chapter.sections
+                    ],
+                }
+                for chapter in outline.chapters
+            ],
+        },
+    }
+
+
+def _outline_from_json(
+    data: dict[str, Any],
+) -> tuple[ValidationResult, MarkoBookOutline]:
+    """
+    Rebuild a ``(validation_result, outline)`` pair saved by :func:`_outline_to_json`.
+
+    Args:
+        data: The loaded JSON data
+
+    Returns:
+        The validation result and the outline
+
+    Raises:
+        KeyError: If ``data`` is missing an entry
+        TypeError: If an entry in ``data`` has the wrong type
+        ValueError: If an entry in ``data`` has an invalid value
+
+    """
+    from ..models.marko_outline import (
+        MarkoBookOutline,
+        MarkoChapter,
+        MarkoContentBlock,
+        MarkoHeadingType,
+        MarkoSection,
+    )
+    from ..models.outline import ValidationError, ValidationResult
+
+    def block(data: list[Any]) -> MarkoContentBlock:
+        content, start_line, end_line = data
+        if not isinstance(content, str):
+            msg = "Content block content must be a string"
+            raise TypeError(msg)
+        return MarkoContentBlock(content, start_line, end_line)
+
+    def errors(data: list[list[Any]]) -> list[ValidationError]:
+        return [ValidationError(*error) for error in data]
+
+    result = data["validation_result"]
+    validation_result = ValidationResult(
+        is_valid=bool(result["is_valid"]),
+        errors=errors(result["errors"]),
+        warnings=errors(result["warnings"]),
+    )
+    outline = data["outline"]
+    return validation_result, MarkoBookOutline(
+        title=outline["title"],
+        introduction_content=block(outline["introduction_content"]),
+        output_dir=Path(outline["output_dir"]),
+        chapters=[
+            MarkoChapter(
+                title=chapter["title"],
+                heading_type=MarkoHeadingType(chapter["heading_type"]),
+                folder_name=chapter["folder_name"],
+                content=block(chapter["content"]),
+                chapter_number=chapter["chapter_number"],
+                appendix_letter=chapter["appendix_letter"],
+                sections=[
+                    MarkoSection(
+                        title=section["title"],
+                        number=section["number"],
+                        content=block(section["content"]),
+                        filename=section["filename"],
+                        section_type=section["section_type"],
+                    )
+                    for section in chapter["sections"]
+                ],
+            )
+            for chapter in outline["chapters"]
+        ],
+    )
+
+
+def _load_cached_outline(
+    cache_path: Path,
+) -> tuple[ValidationResult, MarkoBookOutline] | None:
+    """
+    Load a previously cached ``(validation_result, outline)`` pair.
+
+    Entries that can't be read back, e.g. because they were written by a
+    development version with a different format, are deleted.
+
+    Args:
+        cache_path: Path returned by :func:`_outline_cache_path`
+
+    Returns:
+        The cached pair, or ``None`` if there is no usable cache entry
+
+    """
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        cache_path.unlink(missing_ok=True)
+        return None
+    try:
+        return _outline_from_json(data)
+    except Exception:  # noqa: BLE001
+        # Any malformed entry is just a cache miss
+        cache_path.unlink(missing_ok=True)
+        return None
+
+
+def _store_cached_outline(
+    cache_path: Path,
+    validation_result: ValidationResult,
+    outline: MarkoBookOutline,
+) -> None:
+    """
+    Save a ``(validation_result, outline)`` pair to the on-disk cache.
+
+    The entry is JSON rather than a pickle, so loading a cache entry never
+    runs code.  Failures to write the cache are ignored; caching is only an
+    optimization.
+
+    Args:
+        cache_path: Path returned by :func:`_outline_cache_path`
+        validation_result: The result of validating the markdown file
+        outline: The parsed outline
+
+    """
+    data = json.dumps(_outline_to_json(validation_result, outline))
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(data, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _load_outline(
+    ctx: click.Context,
+    markdown_file: Path,
+    output_dir: Path | None,
+    *,
+    use_cache: bool,
+) -> tuple[ValidationResult, MarkoBookOutline]:
+    """
+    Validate and parse a markdown outline, or load it from the outline cache.
+
+    Args:
+        ctx: Click context object containing utilities and settings
+        markdown_file: Path to the markdown file to convert
+        output_dir: The output directory the outline will be built for
+        use_cache: If True, reuse a cached outline for unchanged input, and
+            cache the outline if there isn't one
+
+    Returns:
+        The validation result and the parsed outline
+
+    Raises:
+        FileError: If the markdown file cannot be read
+        click.ClickException: If validation fails
+
+    """
+    # Import the outline services here rather than at module scope so that
+    # ``rstbuddy --help`` and friends don't pay for loading marko et al.
+    import marko
+
+    from ..services.marko_outline_parser import MarkoOutlineParser
+    from ..services.outline_validator import validate_file_cached
+
+    utils = ctx.obj.get("utils")
+    print_info = utils.print_info
+    print_error = utils.print_error
+
+    # Read the file once; both the validator and parser work on this text
+    try:
+        content = markdown_file.read_text(encoding="utf-8")
+    except OSError as e:
+        msg = f"Failed to read markdown file: {e!s}"
+        raise FileError(msg) from e
+
+    cache_path: Path | None = None
+    if use_cache:
+        cache_path = _outline_cache_path(content.encode("utf-8"), output_dir or "")
+        cached = _load_cached_outline(cache_path)
+        if cached is not None:
+            print_info("✓ Markdown file unchanged, using cached outline")
+            return cached
+
+    # Parse the file once; both the validator and parser walk this document
+    markdown_doc = marko.parse(content)
+
+    # Step 1: Validate the markdown structure
+    print_info("Validating markdown structure...")
+    validation_result = validate_file_cached(markdown_file, content, markdown_doc)
+
+    if not validation_result.is_valid:
+        print_error("Validation failed:")
+        for error in validation_result.errors:
+            print_error(f"  - {error}")
+        msg = "Markdown validation failed"
+        raise click.ClickException(msg)
+
+    print_info("✓ Markdown structure is valid")
+
+    # Step 2: Parse the outline using Marko
+    print_info("Parsing markdown outline with Marko...")
+    parser = MarkoOutlineParser()
+    outline = parser.parse_text(content, output_dir, doc=markdown_doc)
+
+    if cache_path is not None:
+        _store_cached_outline(cache_path, validation_result, outline)
+    return validation_result, outline
+
 
 @cli.command("outline-to-rst")
 @click.argument(
@@ -41,13 +331,33 @@ from .cli import cli
     default=False,
     help="Show what would be created without actually creating files",
 )
+@click.option(
+    "--cache/--no-cache",
+    default=None,
+    help=(
+        "Reuse the validated and parsed outline from a previous run if the "
+        "markdown file is unchanged (default: on with --dry-run, off otherwise)"
+    ),
+)
+@click.option(
+    "--pandoc-cache",
+    is_flag=True,
+    default=False,
+    help=(
+        "Reuse Pandoc conversions of unchanged content blocks saved on disk by "
+        "previous runs, and save new ones"
+    ),
+)
 @click.pass_context
-def outline_to_rst(
+def outline_to_rst(  # noqa: PLR0913
     ctx: click.Context,
+    *,
     markdown_file: Path,
     force: bool,
     output_dir: Path | None,
     dry_run: bool,
+    cache: bool | None,
+    pandoc_cache: bool,
 ) -> None:
     """
     Convert a markdown outline to RST file structure using Marko parser.
@@ -69,6 +379,9 @@ def outline_to_rst(
         force: If True, overwrite existing output directory with backups
         output_dir: Custom output directory (default: uses RSTBUDDY_DOCUMENTATION_DIR)
         dry_run: If True, show what would be created without creating files
+        cache: If True, reuse a cached outline for unchanged input; if None,
+            outline caching is enabled only for dry runs
+        pandoc_cache: If True, reuse and save Pandoc conversions on disk
 
     Raises:
         click.ClickException: If validation, parsing, or conversion fails
@@ -86,6 +399,10 @@ def outline_to_rst(
 
         When dry_run is True, no files are actually created or modified.
     """
+    # Import the converter here rather than at module scope so that
+    # ``rstbuddy --help`` and friends don't pay for loading marko et al.
+    from ..services.marko_outline_converter import MarkoOutlineConverter
+
     utils = ctx.obj.get("utils")
     print_info = utils.print_info
     print_error = utils.print_error
@@ -94,33 +411,31 @@ def outline_to_rst(
         print_info(f"Converting outline: {markdown_file}")
         print_info("Using Marko-based parser for improved reliability")
 
-        # Step 1: Validate the markdown structure
-        print_info("Validating markdown structure...")
-        validator = OutlineValidator()
-        validation_result = validator.validate_file(markdown_file)
-
-        if not validation_result.is_valid:
-            print_error("Validation failed:")
-            for error in validation_result.errors:
-                print_error(f"  - {error}")
-            raise click.ClickException("Markdown validation failed")
-
-        print_info("✓ Markdown structure is valid")
+        # Resolve the default output directory from the settings the CLI has
+        # already loaded, so the parser doesn't construct its own Settings
+        settings = ctx.obj.get("settings")
+        if output_dir is None and settings is not None:
+            output_dir = Path(settings.documentation_dir)
 
-        # Step 2: Parse the outline using Marko
-        print_info("Parsing markdown outline with Marko...")
-        parser = MarkoOutlineParser()
-        outline = parser.parse_file(markdown_file, output_dir)
+        # Dry runs are typically repeated while editing the outline, so they
+        # use the on-disk outline cache unless told otherwise
+        _validation_result, outline = _load_outline(
+            ctx,
+            markdown_file,
+            output_dir,
+            use_cache=dry_run if cache is None else cache,
+        )
 
         print_info(f"✓ Parsed {len(outline.chapters)} chapters")
-        total_sections = sum(len(chapter.sections) for chapter in outline.chapters)
-        print_info(f"✓ Found {total_sections} total sections")
+        print_info(f"✓ Found {outline.total_sections} total sections")
 
         # Step 3: Convert to RST structure
         print_info("Converting to RST structure...")
 
         # Use the new MarkoOutlineConverter directly
-        converter = MarkoOutlineConverter(force=force, dry_run=dry_run)
+        converter = MarkoOutlineConverter(
+            force=force, dry_run=dry_run, persistent_cache=pandoc_cache
+        )
         converter.convert_outline(outline)
 
         if dry_run:
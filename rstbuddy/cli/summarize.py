@@ -25,50 +25,59 @@ def summarize_rst(ctx: click.Context, rst_file: Path) -> None:
     """
     Summarize an RST file by asking an AI assistant.
     """
-    context = ctx.obj
+    settings = ctx.obj.get("settings")
+    utils = ctx.obj.get("utils")
 
-    if not context.settings or not context.utils:
+    if not settings or not utils:
         click.echo("Context not properly initialized", err=True)
         sys.exit(1)
 
+    print_info = utils.print_info
+    print_error = utils.print_error
+    print_success = utils.print_success
+    print_header = utils.print_header
+    print_warning = utils.print_warning
+    output_console = ctx.obj["console"]
+
     # Initialize pandoc converter
     try:
         converter = PandocConverter()
-        context.utils.print_info("Using enhanced pandoc converter")
+        print_info("Using enhanced pandoc converter")
     except NoPandocError as e:
-        context.utils.print_error(f"Pandoc converter initialization failed: {e}")
+        print_error(f"Pandoc converter initialization failed: {e}")
         instructions = get_pandoc_installation_instructions()
-        context.utils.print_error(instructions)
+        print_error(instructions)
         sys.exit(1)
 
     # Read the RST file
-    context.utils.print_header("Step 1: Reading RST file")
+    print_header("Step 1: Reading RST file")
     with rst_file.open(encoding="utf-8") as f:
         rst_content = f.read()
 
-    context.utils.print_success(f"Successfully read {len(rst_content)} characters")
+    print_success(f"Successfully read {len(rst_content)} characters")
 
-    context.utils.print_header("Step 4: Converting RST to Markdown")
-    with context.utils.show_progress("Converting content...") as progress:
+    print_header("Step 4: Converting RST to Markdown")
+    with utils.show_progress() as progress:
         task = progress.add_task("Converting content...", total=None)
         try:
             md_content = converter.convert_rst_to_md(rst_content)
         except ConversionError as e:
-            context.utils.print_error(f"Conversion failed: {e}")
+            print_error(f"Conversion failed: {e}")
             sys.exit(1)
         progress.update(task, completed=True)
 
-    context.utils.print_success("Successfully converted content to Markdown")
+    print_success("Successfully converted content to Markdown")
 
-    context.utils.print_header("Step 3: Generating summary")
-    summary_service = SummaryGenerationService(context.settings, context.console)
+    print_header("Step 3: Generating summary")
+    summary_service = SummaryGenerationService(settings, output_console)
     try:
         # Generate summary for the RST content
         summary = summary_service.generate_summary(md_content)
     except ConfigurationError as e:
-        context.utils.print_warning(f"Summary generation failed: {e}")
+        print_warning(f"Summary generation failed: {e}")
+        sys.exit(1)
 
     # Extract metadata for documentation generation
-    context.utils.print_header("Step 4: Displaying summary")
-    context.console.print()
-    context.console.print(summary)
+    print_header("Step 4: Displaying summary")
+    output_console.print()
+    output_console.print(summary)
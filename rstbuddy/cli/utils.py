@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 console = Console()
 stderr_console = Console(file=sys.stderr)
@@ -18,6 +20,8 @@ def create_progress() -> Progress:
         Configured progress indicator
 
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -34,6 +38,8 @@ def print_error(message: str, suggestions: list[str] | None = None):
         suggestions: List of suggestions to fix the error
 
     """
+    from rich.panel import Panel
+
     error_panel = Panel(
         f"[red]{message}[/red]", title="[bold red]Error[/bold red]", border_style="red"
     )
@@ -53,6 +59,8 @@ def print_success(message: str):
         message: Success message
 
     """
+    from rich.panel import Panel
+
     success_panel = Panel(
         f"[green]{message}[/green]",
         title="[bold green]Success[/bold green]",
@@ -69,6 +77,8 @@ def print_info(message: str):
         message: Informational message
 
     """
+    from rich.panel import Panel
+
     info_panel = Panel(
         f"[blue]{message}[/blue]",
         title="[bold blue]Info[/bold blue]",
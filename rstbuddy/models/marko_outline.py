@@ -8,10 +8,42 @@ independent of the existing regex-based parser models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING
+
+from marko.block import Document
+from marko.md_renderer import MarkdownRenderer
+
+if TYPE_CHECKING:
+    from marko.element import Element
+
+#: Per-thread :class:`MarkdownRenderer`, reused across content blocks.  The
+#: renderer keeps state while rendering, so it can't be shared between threads.
+_renderer_local = threading.local()
+
+
+def _render_markdown(elements: list[Element]) -> str:
+    """
+    Render Marko elements back to markdown.
+
+    Args:
+        elements: The top-level Marko elements to render
+
+    Returns:
+        The rendered markdown
+
+    """
+    renderer = getattr(_renderer_local, "renderer", None)
+    if renderer is None:
+        renderer = _renderer_local.renderer = MarkdownRenderer()
+    document = Document()
+    document.children = elements
+    # Entering the renderer resets the state left over from the previous render
+    with renderer:
+        return renderer.render(document)
 
 
 class MarkoHeadingType(Enum):
@@ -24,28 +56,97 @@ class MarkoHeadingType(Enum):
     PROLOGUE = "prologue"
 
 
-@dataclass
+@dataclass(slots=True, init=False, eq=False)
 class MarkoContentBlock:
     """
     Represents a block of content in the document.
 
     This class stores content along with its position information
     for accurate reconstruction and debugging.
+
+    The block may be created either from markdown text or from the Marko
+    elements it covers; in the latter case the elements are only rendered
+    back to markdown the first time :attr:`content` is read.  Blocks compare
+    equal if their line numbers and markdown content are equal, however the
+    content was given.
+
+    Args:
+        content: The markdown content, or ``None`` to render it from
+            ``elements`` on demand
+        start_line: First line (1-based) of the block
+        end_line: Last line of the block
+
+    Keyword Args:
+        elements: Marko elements to render when ``content`` is ``None``
+
+    Raises:
+        ValueError: If the line numbers are invalid
+
     """
 
-    content: str
     start_line: int
     end_line: int
+    _content: str | None = field(repr=False)
+    _elements: list[Element] | None = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        content: str | None,
+        start_line: int,
+        end_line: int,
+        *,
+        elements: list[Element] | None = None,
+    ) -> None:
+        if content is None and elements is None:
+            msg = "Either content or elements must be given"
+            raise ValueError(msg)
+        self.start_line = start_line
+        self.end_line = end_line
+        self._content = content
+        self._elements = elements
+        self.__post_init__()
 
     def __post_init__(self) -> None:
         """Validate content block data."""
         if self.start_line > self.end_line:
-            raise ValueError("start_line cannot be greater than end_line")
+            msg = "start_line cannot be greater than end_line"
+            raise ValueError(msg)
         if self.start_line < 1:
-            raise ValueError("start_line must be 1 or greater")
-
-
-@dataclass
+            msg = "start_line must be 1 or greater"
+            raise ValueError(msg)
+
+    #: Blocks are mutable, so they aren't hashable
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        # Compare the rendered markdown, so that a block whose elements
+        # haven't been rendered yet compares the same as it will afterwards
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.content, self.start_line, self.end_line) == (
+            other.content,
+            other.start_line,
+            other.end_line,
+        )
+
+    def __getstate__(self) -> tuple[str, int, int]:
+        # Pickle the rendered markdown, not the Marko elements
+        return (self.content, self.start_line, self.end_line)
+
+    def __setstate__(self, state: tuple[str, int, int]) -> None:
+        self._content, self.start_line, self.end_line = state
+        self._elements = None
+
+    @property
+    def content(self) -> str:
+        """The block's markdown content, rendered on first access."""
+        if self._content is None:
+            self._content = _render_markdown(self._elements)
+            self._elements = None
+        return self._content
+
+
+@dataclass(slots=True)
 class MarkoSection:
     """
     Represents a section within a chapter or appendix.
@@ -68,7 +169,7 @@ class MarkoSection:
             raise ValueError("section_type must be 'numbered' or 'content'")
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkoChapter:
     """
     Represents a chapter or appendix in the document.
@@ -81,7 +182,7 @@ class MarkoChapter:
     heading_type: MarkoHeadingType
     folder_name: str
     content: MarkoContentBlock
-    sections: List[MarkoSection]
+    sections: list[MarkoSection]
     chapter_number: int | None = None  # For numbered chapters
     appendix_letter: str | None = None  # For appendices
 
@@ -92,8 +193,13 @@ class MarkoChapter:
         if not self.folder_name:
             raise ValueError("Chapter folder_name cannot be empty")
 
+    @property
+    def actual_sections(self) -> list[MarkoSection]:
+        """The sections that get their own file (those with a filename)."""
+        return [s for s in self.sections if s.filename]
 
-@dataclass
+
+@dataclass(slots=True)
 class MarkoBookOutline:
     """
     Represents the complete structure of a book document.
@@ -104,7 +210,7 @@ class MarkoBookOutline:
 
     title: str
     introduction_content: MarkoContentBlock
-    chapters: List[MarkoChapter]
+    chapters: list[MarkoChapter]
     output_dir: Path
 
     def __post_init__(self) -> None:
@@ -113,3 +219,8 @@ class MarkoBookOutline:
             raise ValueError("Book title cannot be empty")
         if not self.output_dir:
             raise ValueError("Output directory cannot be empty")
+
+    @property
+    def total_sections(self) -> int:
+        """The number of sections across all chapters."""
+        return sum(len(chapter.sections) for chapter in self.chapters)
@@ -10,7 +10,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
 
 
 class HeadingType(Enum):
@@ -23,7 +22,7 @@ class HeadingType(Enum):
     APPENDIX = "appendix"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentBlock:
     """A block of content between headings."""
 
@@ -32,7 +31,7 @@ class ContentBlock:
     line_end: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section within a chapter."""
 
@@ -42,7 +41,7 @@ class Section:
     filename: str  # sanitized filename
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     """A chapter in the book."""
 
@@ -50,22 +49,27 @@ class Chapter:
     heading_type: HeadingType
     folder_name: str
     content: ContentBlock
-    sections: List[Section]
-    chapter_number: Optional[int] = None
-    appendix_letter: Optional[str] = None
+    sections: list[Section]
+    chapter_number: int | None = None
+    appendix_letter: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BookOutline:
     """Complete book outline structure."""
 
     title: str
     introduction_content: ContentBlock
-    chapters: List[Chapter]
+    chapters: list[Chapter]
     output_dir: Path
 
+    @property
+    def total_sections(self) -> int:
+        """The number of sections across all chapters."""
+        return sum(len(chapter.sections) for chapter in self.chapters)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationError:
     """Validation error details."""
 
@@ -74,10 +78,10 @@ class ValidationError:
     severity: str = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of markdown validation."""
 
     is_valid: bool
-    errors: List[ValidationError]
-    warnings: List[ValidationError]
+    errors: list[ValidationError]
+    warnings: list[ValidationError]
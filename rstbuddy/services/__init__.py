@@ -1,5 +1,32 @@
-from .outline_validator import OutlineValidator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .outline_validator import OutlineValidator
 
 __all__ = [
     "OutlineValidator",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily import the public service classes on first access.
+
+    This keeps ``import rstbuddy.services`` cheap: the heavy third-party
+    dependencies (``marko``, etc.) are only loaded when a service is used.
+
+    Args:
+        name: The attribute being looked up on this package
+
+    Raises:
+        AttributeError: If ``name`` is not a public service
+
+    """
+    if name == "OutlineValidator":
+        from .outline_validator import OutlineValidator
+
+        return OutlineValidator
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
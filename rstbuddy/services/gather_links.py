@@ -15,6 +15,7 @@ The service:
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 from datetime import datetime
@@ -83,8 +84,12 @@ class RSTLinkGatherer:
             print(f"Scanning RST files in {self.documentation_dir}")
 
         # Scan all RST files
-        rst_files = list(self.documentation_dir.rglob("*.rst"))
-        rst_files = [f for f in rst_files if f.name != "_links.rst"]
+        rst_files = [
+            Path(dirpath, filename)
+            for dirpath, _dirnames, filenames in os.walk(self.documentation_dir)
+            for filename in filenames
+            if filename.endswith(".rst") and filename != "_links.rst"
+        ]
 
         if not dry_run:
             print(f"Found {len(rst_files)} RST files to process")
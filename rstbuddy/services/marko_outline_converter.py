@@ -7,12 +7,17 @@ folder organization and toctree entries.
 
 from __future__ import annotations
 
+import os
+import sys
+from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .rst_utils import (
     backup_and_write_file,
+    backup_timestamp,
     convert_content_to_rst,
+    convert_contents_to_rst,
     filter_chapter_heading_marko,
     filter_section_heading,
     get_clean_chapter_title_marko,
@@ -21,13 +26,38 @@ from .rst_utils import (
 from ..models.marko_outline import MarkoHeadingType
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from ..models.marko_outline import (
         MarkoBookOutline,
         MarkoChapter,
         MarkoSection,
-        MarkoHeadingType,
     )
 
+#: Chapter heading types listed under "Front Matter" in the top-level toctree
+FRONT_MATTER_HEADING_TYPES = frozenset(
+    {MarkoHeadingType.INTRODUCTION, MarkoHeadingType.PROLOGUE}
+)
+#: Chapter heading types listed under "Appendices" in the top-level toctree
+APPENDIX_HEADING_TYPES = frozenset({MarkoHeadingType.APPENDIX})
+
+
+def _toctree(entries: Iterable[str], caption: str | None = None) -> str:
+    """
+    Build a hidden ``toctree`` directive.
+
+    Args:
+        entries: The documents to list in the toctree
+        caption: Optional caption for the toctree
+
+    Returns:
+        The directive, ending with a newline
+
+    """
+    options = f"   :caption: {caption}\n" if caption else ""
+    items = "".join(f"   {entry}\n" for entry in entries)
+    return f".. toctree::\n{options}   :hidden:\n\n{items}"
+
 
 class MarkoOutlineConverter:
     """
@@ -41,22 +71,44 @@ class MarkoOutlineConverter:
     Attributes:
         force: Whether to force overwrite existing files
         dry_run: Whether to show what would be created without creating files
-        _content_cache: In-memory cache for Pandoc conversion results
+        persistent_cache: Whether to use the on-disk Pandoc conversion cache
+        _content_cache: In-memory cache for Pandoc conversion results, filled in
+            one batch by :meth:`_precompute_conversions`
+        _filtered_cache: In-memory cache of markdown blocks with their heading
+            removed, keyed by filter function, heading title and raw markdown
+        _backup_timestamp: Timestamp shared by every backup made by the
+            current :meth:`convert_outline` call
+        _written_hashes: Digests of the content of files this converter has
+            written or found unchanged, so converting an outline again with
+            the same converter doesn't have to read them back
 
     """
 
-    def __init__(self, force: bool = False, dry_run: bool = False):
+    def __init__(
+        self,
+        force: bool = False,
+        dry_run: bool = False,
+        persistent_cache: bool = False,
+    ):
         """
         Initialize the Marko outline converter.
 
         Args:
             force: If True, overwrite existing files with timestamped backups
             dry_run: If True, show what would be created without creating files
+            persistent_cache: If True, reuse Pandoc conversions saved on disk
+                by previous runs, and save new ones
 
         """
         self.force = force
         self.dry_run = dry_run
+        self.persistent_cache = persistent_cache
         self._content_cache: dict[str, str] = {}  # Cache for pandoc conversions
+        self._filtered_cache: dict[
+            tuple[Callable[[str, str], str], str, str], str
+        ] = {}  # Cache for heading-filtered markdown
+        self._written_hashes: dict[Path, bytes] = {}  # Digests of written files
+        self._backup_timestamp: str | None = None  # Set per convert_outline()
 
     def convert_outline(self, outline: MarkoBookOutline) -> None:
         """
@@ -78,15 +130,129 @@ class MarkoOutlineConverter:
             self._show_dry_run_plan(outline)
             return
 
+        # Name every backup made by this run with the same timestamp
+        self._backup_timestamp = backup_timestamp()
+
         # Create output directory
         self._create_output_directory(outline.output_dir)
+        self._create_chapter_directories(outline)
+
+        # Convert all content blocks to RST up front with one Pandoc process
+        self._precompute_conversions(outline)
+
+        # Build the content of every file: the top-level index.rst, then each
+        # chapter's files
+        pending = [self._generate_top_level_index(outline)]
+        for chapter in outline.chapters:
+            pending.extend(self._generate_chapter_files(outline.output_dir, chapter))
+
+        # Write the files in document order.  This stays in this thread:
+        # backup_and_write_file() reports each file with print(), and output
+        # from concurrent writers interleaves and comes out in a different
+        # order on every run.
+        for file in pending:
+            self._write_file(file)
+
+    def _precompute_conversions(self, outline: MarkoBookOutline) -> None:
+        """
+        Convert every content block in the outline to RST in a single batch.
 
-        # Generate top-level index.rst
-        self._generate_top_level_index(outline)
+        This fills :attr:`_content_cache` so that the ``_generate_*`` methods
+        only do cache lookups instead of running Pandoc once per file.
+
+        Args:
+            outline: The complete Marko book outline structure
 
-        # Generate chapter files
+        """
+        contents = [self._introduction_markdown(outline)]
         for chapter in outline.chapters:
-            self._generate_chapter_files(outline.output_dir, chapter)
+            contents.append(self._chapter_markdown(chapter))
+            contents.extend(
+                self._section_markdown(section) for section in chapter.actual_sections
+            )
+        convert_contents_to_rst(
+            contents, self._content_cache, persistent_cache=self.persistent_cache
+        )
+
+    def _introduction_markdown(self, outline: MarkoBookOutline) -> str:
+        """
+        Return the book's introduction markdown, minus the book title heading.
+
+        Args:
+            outline: The complete Marko book outline structure
+
+        Returns:
+            The filtered markdown, or ``""`` if there is no introduction
+
+        """
+        # Filter out the original chapter heading to avoid duplicate headings
+        return self._filter_heading(
+            filter_chapter_heading_marko,
+            outline.introduction_content.content,
+            outline.title,
+        )
+
+    def _chapter_markdown(self, chapter: MarkoChapter) -> str:
+        """
+        Return a chapter's markdown, minus the chapter heading.
+
+        Args:
+            chapter: The chapter
+
+        Returns:
+            The filtered markdown, or ``""`` if the chapter has no content
+
+        """
+        # Filter out the original chapter heading to avoid duplicate headings
+        return self._filter_heading(
+            filter_chapter_heading_marko, chapter.content.content, chapter.title
+        )
+
+    def _section_markdown(self, section: MarkoSection) -> str:
+        """
+        Return a section's markdown, minus the section heading.
+
+        Args:
+            section: The section
+
+        Returns:
+            The filtered markdown, or ``""`` if the section has no content
+
+        """
+        # Filter out the original section heading to avoid duplicate headings
+        return self._filter_heading(
+            filter_section_heading, section.content.content, section.title
+        )
+
+    def _filter_heading(
+        self, filter_heading: Callable[[str, str], str], content: str, title: str
+    ) -> str:
+        """
+        Remove a heading from markdown content, memoizing the result.
+
+        The same block is filtered both by :meth:`_precompute_conversions` and
+        when its file is generated, so the result is kept in
+        :attr:`_filtered_cache` and the filter only runs once per block.
+
+        Args:
+            filter_heading: The ``filter_*_heading`` function to apply
+            content: The block's markdown content
+            title: The heading title to remove
+
+        Returns:
+            The filtered markdown, or ``""`` if ``content`` is blank
+
+        """
+        key = (filter_heading, title, content)
+        try:
+            return self._filtered_cache[key]
+        except KeyError:
+            pass
+        # ``not content.isspace()`` is ``content.strip()`` without the copy
+        has_content = content and not content.isspace()
+        filtered = filter_heading(content, title) if has_content else ""
+        self._filtered_cache[key] = filtered
+        return filtered
 
     def _create_output_directory(self, output_dir: Path) -> None:
         """
@@ -113,9 +279,30 @@ class MarkoOutlineConverter:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _generate_top_level_index(self, outline: MarkoBookOutline) -> None:
+    def _create_chapter_directories(self, outline: MarkoBookOutline) -> None:
+        """
+        Create the directory for each chapter that doesn't already have one.
+
+        The output directory is listed once so that re-running a conversion
+        doesn't make a ``mkdir`` call per chapter only to have it fail with
+        ``EEXIST``.
+
+        Args:
+            outline: The complete Marko book outline structure
+
+        Raises:
+            OSError: If a directory cannot be created
+
         """
-        Generate the top-level index.rst file.
+        with os.scandir(outline.output_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        for folder_name in dict.fromkeys(c.folder_name for c in outline.chapters):
+            if folder_name not in existing:
+                (outline.output_dir / folder_name).mkdir()
+
+    def _generate_top_level_index(self, outline: MarkoBookOutline) -> tuple[Path, str]:
+        """
+        Generate the top-level index.rst file's content.
 
         Creates the main index.rst file that serves as the entry point
         for the documentation. Includes the book title, introduction content,
@@ -124,195 +311,200 @@ class MarkoOutlineConverter:
         Args:
             outline: The complete Marko book outline structure
 
-        Raises:
-            OSError: If file operations fail during writing
+        Returns:
+            The path of the index.rst file and its content
 
         """
         index_path = outline.output_dir / "index.rst"
 
-        content = []
+        # Each block after the title starts with the blank line separating it
+        # from the previous one
+        buf = StringIO()
+        write = buf.write
 
         # Book title
-        content.append("#" * len(outline.title))
-        content.append(outline.title)
-        content.append("#" * len(outline.title))
-        content.append("")
+        rule = "#" * len(outline.title)
+        write(f"{rule}\n{outline.title}\n{rule}\n")
 
         # Introduction content
-        if outline.introduction_content.content.strip():
-            # Filter out the original chapter heading to avoid duplicate headings
-            filtered_content = filter_chapter_heading_marko(
-                outline.introduction_content.content, outline.title
-            )
-            rst_content = convert_content_to_rst(filtered_content, self._content_cache)
-            content.append(rst_content)
-            content.append("")
-
-        # Table of contents for front matter (Introduction and Prologue)
-        front_matter = [
-            c
-            for c in outline.chapters
-            if c.heading_type
-            in [MarkoHeadingType.INTRODUCTION, MarkoHeadingType.PROLOGUE]
-        ]
-        if front_matter:
-            content.append(".. toctree::")
-            content.append("   :caption: Front Matter")
-            content.append("   :hidden:")
-            content.append("")
-            content.extend(
-                [f"   {chapter.folder_name}/index" for chapter in front_matter]
+        introduction = outline.introduction_content.content
+        if introduction and not introduction.isspace():
+            filtered_content = self._filter_heading(
+                filter_chapter_heading_marko, introduction, outline.title
             )
-            content.append("")
-
-        # Table of contents for regular chapters
-        chapters = [
-            c
-            for c in outline.chapters
-            if c.heading_type
-            not in [
-                MarkoHeadingType.APPENDIX,
-                MarkoHeadingType.INTRODUCTION,
-                MarkoHeadingType.PROLOGUE,
-            ]
-        ]
-        if chapters:
-            content.append(".. toctree::")
-            content.append("   :caption: Chapters")
-            content.append("   :hidden:")
-            content.append("")
-            content.extend([f"   {chapter.folder_name}/index" for chapter in chapters])
-            content.append("")
-
-        # Table of contents for appendices
-        appendices = [
-            c for c in outline.chapters if c.heading_type == MarkoHeadingType.APPENDIX
-        ]
-        if appendices:
-            content.append(".. toctree::")
-            content.append("   :caption: Appendices")
-            content.append("   :hidden:")
-            content.append("")
-            content.extend(
-                [f"   {appendix.folder_name}/index" for appendix in appendices]
+            rst_content = convert_content_to_rst(
+                filtered_content,
+                self._content_cache,
+                persistent_cache=self.persistent_cache,
             )
-            content.append("")
+            write(f"\n{rst_content}\n")
 
-        # Use smart backup and write
-        final_content = "\n".join(content)
-        backup_and_write_file(index_path, final_content, self.force, self.dry_run)
-
-    def _generate_chapter_files(self, output_dir: Path, chapter: MarkoChapter) -> None:
+        # Partition the chapters into front matter (Introduction and Prologue),
+        # regular chapters and appendices
+        front_matter: list[MarkoChapter] = []
+        chapters: list[MarkoChapter] = []
+        appendices: list[MarkoChapter] = []
+        for chapter in outline.chapters:
+            heading_type = chapter.heading_type
+            if heading_type in FRONT_MATTER_HEADING_TYPES:
+                front_matter.append(chapter)
+            elif heading_type in APPENDIX_HEADING_TYPES:
+                appendices.append(chapter)
+            else:
+                chapters.append(chapter)
+
+        # Tables of contents for front matter, regular chapters and appendices
+        for caption, group in (
+            ("Front Matter", front_matter),
+            ("Chapters", chapters),
+            ("Appendices", appendices),
+        ):
+            if group:
+                entries = (f"{chapter.folder_name}/index" for chapter in group)
+                write(f"\n{_toctree(entries, caption)}")
+
+        return index_path, buf.getvalue()
+
+    def _generate_chapter_files(
+        self, output_dir: Path, chapter: MarkoChapter
+    ) -> list[tuple[Path, str]]:
         """
-        Generate files for a single chapter.
+        Generate the content of the files for a single chapter.
 
-        Creates the chapter directory and generates both the chapter's
-        index.rst file and individual section files.
+        Generates both the chapter's index.rst file and individual section
+        files.
 
         Args:
             output_dir: Base output directory
             chapter: Chapter to generate files for
 
-        Raises:
-            OSError: If file operations fail during directory creation or writing
+        Returns:
+            The path and content of each of the chapter's files
 
         """
         chapter_dir = output_dir / chapter.folder_name
-        chapter_dir.mkdir(exist_ok=True)
 
         # Generate chapter index.rst
-        self._generate_chapter_index(chapter_dir, chapter)
+        files = [self._generate_chapter_index(chapter_dir, chapter)]
 
         # Generate section files (only for actual sections, not content headings)
-        for section in chapter.sections:
-            if section.filename:  # Only create files for sections with filenames
-                self._generate_section_file(chapter_dir, section)
-
-    def _generate_chapter_index(self, chapter_dir: Path, chapter: MarkoChapter) -> None:
+        files.extend(
+            self._generate_section_file(chapter_dir, section)
+            for section in chapter.actual_sections
+        )
+        return files
+
+    def _generate_chapter_index(
+        self, chapter_dir: Path, chapter: MarkoChapter
+    ) -> tuple[Path, str]:
         """
-        Generate the index.rst file for a chapter.
+        Generate the content of the index.rst file for a chapter.
 
-        Creates a chapter's index.rst file containing the chapter title,
-        chapter content, and a table of contents for its sections.
+        The file contains the chapter title, chapter content, and a table of
+        contents for its sections.
 
         Args:
             chapter_dir: Directory where the chapter files should be created
             chapter: Chapter to generate the index for
 
-        Raises:
-            OSError: If file operations fail during writing
+        Returns:
+            The path of the chapter's index.rst file and its content
 
         """
         index_path = chapter_dir / "index.rst"
 
-        content = []
+        buf = StringIO()
+        write = buf.write
 
         # Chapter title (clean version without prefix)
         clean_title = get_clean_chapter_title_marko(chapter.title)
-        content.append(clean_title)
-        content.append("=" * len(clean_title))
-        content.append("")
+        write(f"{clean_title}\n{'=' * len(clean_title)}\n")
 
         # Table of contents for sections (immediately after title)
-        actual_sections = [s for s in chapter.sections if s.filename]
+        actual_sections = chapter.actual_sections
         if actual_sections:
-            content.append(".. toctree::")
-            content.append("   :hidden:")
-            content.append("")
-            content.extend([f"   {section.filename}" for section in actual_sections])
-            content.append("")
+            entries = (section.filename for section in actual_sections)
+            write(f"\n{_toctree(entries)}")
 
         # Chapter content
-        if chapter.content.content.strip():
-            # Filter out the original chapter heading to avoid duplicate headings
-            filtered_content = filter_chapter_heading_marko(
-                chapter.content.content, chapter.title
+        content = chapter.content.content
+        if content and not content.isspace():
+            filtered_content = self._filter_heading(
+                filter_chapter_heading_marko, content, chapter.title
+            )
+            rst_content = convert_content_to_rst(
+                filtered_content,
+                self._content_cache,
+                persistent_cache=self.persistent_cache,
             )
-            rst_content = convert_content_to_rst(filtered_content, self._content_cache)
-            content.append(rst_content)
-            content.append("")
+            write(f"\n{rst_content}\n")
 
-        # Write the file
-        final_content = "\n".join(content)
-        backup_and_write_file(index_path, final_content, self.force, self.dry_run)
+        return index_path, buf.getvalue()
 
-    def _generate_section_file(self, chapter_dir: Path, section: MarkoSection) -> None:
+    def _generate_section_file(
+        self, chapter_dir: Path, section: MarkoSection
+    ) -> tuple[Path, str]:
         """
-        Generate a section file.
+        Generate the content of a section file.
 
-        Creates an individual RST file for a section containing the
-        section title and content.
+        The file contains the section title and content.
 
         Args:
             chapter_dir: Directory where the section file should be created
             section: Section to generate the file for
 
-        Raises:
-            OSError: If file operations fail during writing
+        Returns:
+            The path of the section file and its content
 
         """
         section_path = chapter_dir / section.filename
 
-        content = []
+        buf = StringIO()
+        write = buf.write
 
         # Section title (clean version without number prefix)
         clean_title = get_clean_section_title(section.title)
-        content.append(clean_title)
-        content.append("-" * len(clean_title))
-        content.append("")
+        write(f"{clean_title}\n{'-' * len(clean_title)}\n")
 
         # Section content
-        if section.content.content.strip():
-            # Filter out the original section heading to avoid duplicate headings
-            filtered_content = filter_section_heading(
-                section.content.content, section.title
+        content = section.content.content
+        if content and not content.isspace():
+            filtered_content = self._filter_heading(
+                filter_section_heading, content, section.title
+            )
+            rst_content = convert_content_to_rst(
+                filtered_content,
+                self._content_cache,
+                persistent_cache=self.persistent_cache,
             )
-            rst_content = convert_content_to_rst(filtered_content, self._content_cache)
-            content.append(rst_content)
+            write(f"\n{rst_content}")
 
-        # Write the file
-        final_content = "\n".join(content)
-        backup_and_write_file(section_path, final_content, self.force, self.dry_run)
+        return section_path, buf.getvalue()
+
+    def _write_file(self, file: tuple[Path, str]) -> None:
+        """
+        Write a generated file, backing up any existing file if needed.
+
+        The chapter directories must already exist; see
+        :meth:`_create_chapter_directories`.
+
+        Args:
+            file: The path of the file and its content, as returned by the
+                ``_generate_*`` methods
+
+        Raises:
+            OSError: If file operations fail during writing
+
+        """
+        path, content = file
+        backup_and_write_file(
+            path,
+            content,
+            self.force,
+            self.dry_run,
+            written_hashes=self._written_hashes,
+            backup_timestamp=self._backup_timestamp,
+        )
 
     def _show_dry_run_plan(self, outline: MarkoBookOutline) -> None:
         """
@@ -322,36 +514,45 @@ class MarkoOutlineConverter:
             outline: The outline to show the plan for
 
         """
-        print("=== DRY RUN - No files will be created ===")
-        print(f"Book title: {outline.title}")
-        print(f"Output directory: {outline.output_dir}")
-        print(f"Chapters: {len(outline.chapters)}")
-        print()
+        lines = [
+            "=== DRY RUN - No files will be created ===",
+            f"Book title: {outline.title}",
+            f"Output directory: {outline.output_dir}",
+            f"Chapters: {len(outline.chapters)}",
+            "",
+        ]
 
         for chapter in outline.chapters:
-            print(f"Chapter: {chapter.title}")
-            print(f"  Folder: {chapter.folder_name}")
-            print(f"  Sections: {len([s for s in chapter.sections if s.filename])}")
+            lines.append(f"Chapter: {chapter.title}")
+            lines.append(f"  Folder: {chapter.folder_name}")
+            actual_sections = chapter.actual_sections
+            lines.append(f"  Sections: {len(actual_sections)}")
 
             # Show sections
-            actual_sections = [s for s in chapter.sections if s.filename]
-            if actual_sections:
-                for section in actual_sections:
-                    print(f"    - {section.title} -> {section.filename}")
-            print()
+            lines.extend(
+                f"    - {section.title} -> {section.filename}"
+                for section in actual_sections
+            )
+            lines.append("")
 
         # Show files that would be created
-        print("Files that would be created:")
-        self._list_files_to_create(outline)
-        print("✓ Dry run completed - no files were created")
+        lines.append("Files that would be created:")
+        lines.extend(self._list_files_to_create(outline))
+        lines.append("✓ Dry run completed - no files were created")
+
+        # One write rather than a print() per line
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
 
-    def _list_files_to_create(self, outline: MarkoBookOutline) -> None:
+    def _list_files_to_create(self, outline: MarkoBookOutline) -> list[str]:
         """
         List all files that would be created.
 
         Args:
             outline: The outline to list files for
 
+        Returns:
+            One indented line per file
+
         """
         files_to_create = []
 
@@ -366,44 +567,53 @@ class MarkoOutlineConverter:
 
         # Section files
         for chapter in outline.chapters:
-            for section in chapter.sections:
-                if section.filename:
-                    files_to_create.append(
-                        f"  {outline.output_dir}/{chapter.folder_name}/{section.filename}"
-                    )
+            files_to_create.extend(
+                f"  {outline.output_dir}/{chapter.folder_name}/{section.filename}"
+                for section in chapter.actual_sections
+            )
 
-        # Print all files
-        for file_path in files_to_create:
-            print(file_path)
+        return files_to_create
 
     def show_generated_structure(self, outline: MarkoBookOutline) -> None:
         """
         Display the generated file structure.
 
+        The whole tree is written to stdout at once.
+
+        Args:
+            outline: The outline that was converted
+
+        """
+        sys.stdout.write(
+            "".join(f"{line}\n" for line in self._iter_generated_structure(outline))
+        )
+
+    def _iter_generated_structure(self, outline: MarkoBookOutline) -> Iterator[str]:
+        """
+        Yield the lines of the generated file structure tree.
+
         Args:
             outline: The outline that was converted
 
+        Yields:
+            One line of the tree at a time
+
         """
-        print(f"└── {outline.output_dir.name}/")
+        yield f"└── {outline.output_dir.name}/"
 
         # Show chapters and their sections
         for chapter in outline.chapters:
-            print(f"    ├── {chapter.folder_name}/")
+            yield f"    ├── {chapter.folder_name}/"
 
             # Show sections
-            actual_sections = [s for s in chapter.sections if s.filename]
+            actual_sections = chapter.actual_sections
+            last = len(actual_sections) - 1
             for i, section in enumerate(actual_sections):
-                if i == len(actual_sections) - 1:
-                    # Last section
-                    print(f"    │   └── {section.filename}")
-                else:
-                    print(f"    │   ├── {section.filename}")
+                branch = "└──" if i == last else "├──"
+                yield f"    │   {branch} {section.filename}"
 
             # Show chapter index
-            if actual_sections:
-                print("    │   └── index.rst")
-            else:
-                print("    │   └── index.rst")
+            yield "    │   └── index.rst"
 
         # Show top-level index
-        print("    └── index.rst")
+        yield "    └── index.rst"
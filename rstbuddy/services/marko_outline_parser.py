@@ -7,12 +7,13 @@ using Marko's AST approach instead of regex-based line parsing.
 
 from __future__ import annotations
 
+import functools
 import re
+from bisect import bisect_left
 from pathlib import Path
 from typing import List, Any
 
 import marko
-from marko.md_renderer import MarkdownRenderer
 from marko.block import Document, Heading
 
 from ..models.marko_outline import (
@@ -24,6 +25,58 @@ from ..models.marko_outline import (
 )
 from ..settings import Settings
 
+#: Classifies a chapter-level (H2) heading in one match; the name of the
+#: alternative that matched is the heading's kind
+CHAPTER_HEADING_KIND_PATTERN = re.compile(
+    r"(?P<prologue>Prologue)"
+    r"|(?P<introduction>Introduction)"
+    r"|Chapter\s+(?P<chapter>\d+):"
+    r"|(?P<appendix>Appendix )"
+)
+#: Regex pattern for matching appendix headings
+APPENDIX_PATTERN = re.compile(r"^Appendix\s+([A-Z]):\s*(.*)")
+#: Canonical regex pattern for section headings (two levels maximum)
+SECTION_PATTERN = re.compile(r"^(\d+\.\d+|[A-Z]\.\d+)(?!\.\d)\s+(.*)")
+
+#: Characters that are dropped from section titles when building filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w\s-]")
+#: Translation table deleting the ASCII members of
+#: :data:`_UNSAFE_FILENAME_CHARS`, used for the common all-ASCII title
+_UNSAFE_ASCII_TABLE = str.maketrans(
+    dict.fromkeys(c for c in map(chr, range(128)) if _UNSAFE_FILENAME_CHARS.match(c))
+)
+#: Runs of whitespace and dashes, collapsed to a single dash in filenames
+_DASH_RUN = re.compile(r"[-\s]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_filename(title: str) -> str:
+    """
+    Convert section title to a safe filename.
+
+    Outlines repeat section titles such as "Summary" across chapters, so
+    results are memoized.
+
+    Args:
+        title: Section title to convert
+
+    Returns:
+        Safe filename with .rst extension
+    """
+    # Remove or replace problematic characters
+    if title.isascii():
+        filename = title.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        filename = _UNSAFE_FILENAME_CHARS.sub("", title)
+    filename = _DASH_RUN.sub("-", filename).strip("-").lower()
+
+    # Ensure it's not empty
+    if not filename:
+        filename = "section"
+
+    # Add .rst extension
+    return f"{filename}.rst"
+
 
 class MarkoOutlineParser:
     """
@@ -34,20 +87,6 @@ class MarkoOutlineParser:
     provides a more reliable alternative to regex-based parsing.
     """
 
-    def __init__(self) -> None:
-        """
-        Initialize the Marko outline parser.
-
-        Sets up regex patterns for identifying different types of headings
-        and section numbering patterns.
-        """
-        #: Regex pattern for matching chapter headings
-        self._chapter_pattern = re.compile(r"^Chapter\s+(\d+):\s*(.*)")
-        #: Regex pattern for matching appendix headings
-        self._appendix_pattern = re.compile(r"^Appendix\s+([A-Z]):\s*(.*)")
-        #: Canonical regex pattern for section headings (two levels maximum)
-        self._section_pattern = re.compile(r"^(\d+\.\d+|[A-Z]\.\d+)(?!\.\d)\s+(.*)")
-
     def parse_file(
         self, file_path: Path, output_dir: Path | None = None
     ) -> MarkoBookOutline:
@@ -73,8 +112,34 @@ class MarkoOutlineParser:
         with file_path.open(encoding="utf-8") as f:
             content = f.read()
 
-        # Parse with Marko
-        doc = marko.parse(content)
+        return self.parse_text(content, output_dir)
+
+    def parse_text(
+        self,
+        content: str,
+        output_dir: Path | None = None,
+        *,
+        doc: Document | None = None,
+    ) -> MarkoBookOutline:
+        """
+        Parse markdown text to extract book outline structure.
+
+        Use this instead of :meth:`parse_file` when the caller has already
+        read the file, e.g. to share a single read with the validator.
+
+        Args:
+            content: The markdown text to parse
+            output_dir: Custom output directory (default: uses settings)
+            doc: ``content`` already parsed by Marko, if the caller has it,
+                e.g. to share a single parse with the validator
+
+        Returns:
+            MarkoBookOutline with complete structure
+
+        """
+        # Parse with Marko, unless the caller already has
+        if doc is None:
+            doc = marko.parse(content)
 
         # Parse the structure
         title, introduction_content, chapters = self._parse_structure(doc)
@@ -111,55 +176,65 @@ class MarkoOutlineParser:
         """
         children = list(doc.children)
 
-        # Extract title (first H1)
         title = ""
-        title_end_idx = 0
-
-        for i, child in enumerate(children):
-            if isinstance(child, Heading) and child.level == 1:
-                title = self._extract_heading_text(child)
-                title_end_idx = i
-                break
-
-        if not title:
-            raise ValueError("Document must have a title (H1 heading)")
-
-        # Extract introduction content (between title and first H2)
-        introduction_start = title_end_idx + 1
-        introduction_end = len(children)
-
-        for i in range(introduction_start, len(children)):
-            if isinstance(children[i], Heading) and children[i].level == 2:
-                introduction_end = i
-                break
-
-        introduction_content = self._extract_content_block(
-            children, introduction_start, introduction_end
-        )
-
-        # Extract chapters
+        title_idx: int | None = None
+        introduction_end: int | None = None
         chapters = []
         current_chapter = None
-
+        # Indices of the H1-H3 headings seen so far, in document order.  When
+        # a chapter is finalized every heading before its end has been seen,
+        # so this is complete for the range it is searched over.
+        heading_breaks: list[int] = []
+
+        # Walk the top-level children once, picking up the title (first H1),
+        # the end of the introduction (first H2 after the title) and the
+        # chapters as we go.  ``SetextHeading`` is not a ``Heading`` subclass,
+        # so an exact type check matches what ``isinstance`` would; the class
+        # is bound to a local to keep the per-child check to one comparison.
+        heading_cls = Heading
         for i, child in enumerate(children):
-            if isinstance(child, Heading) and child.level == 2:
+            if type(child) is not heading_cls:
+                continue
+            level = child.level
+            if level <= 3:
+                heading_breaks.append(i)
+            if level == 1:
+                if title_idx is None:
+                    title = self._extract_heading_text(child)
+                    title_idx = i
+            elif level == 2:
+                if title_idx is not None and introduction_end is None:
+                    introduction_end = i
+
                 # Finalize previous chapter if it exists
                 if current_chapter:
-                    self._finalize_chapter(children, current_chapter, i)
+                    self._finalize_chapter(children, current_chapter, i, heading_breaks)
                     chapters.append(current_chapter)
 
                 # Start new chapter
                 current_chapter = self._parse_chapter_heading(child, i)
-            elif isinstance(child, Heading) and child.level == 3 and current_chapter:
+            elif level == 3 and current_chapter:
                 # Process section heading - ONLY H3 headings are sections
                 self._process_section_heading(child, i, children, current_chapter)
             # Note: H4 and deeper headings are ignored - they're not sections
 
+        if not title:
+            raise ValueError("Document must have a title (H1 heading)")
+
         # Finalize the last chapter
         if current_chapter:
-            self._finalize_chapter(children, current_chapter, len(children))
+            self._finalize_chapter(
+                children, current_chapter, len(children), heading_breaks
+            )
             chapters.append(current_chapter)
 
+        # Extract introduction content (between title and first H2)
+        introduction_content = self._extract_content_block(
+            children,
+            title_idx + 1,
+            len(children) if introduction_end is None else introduction_end,
+        )
+
         return title, introduction_content, chapters
 
     def _extract_heading_text(self, heading_element: Heading) -> str:
@@ -172,28 +247,23 @@ class MarkoOutlineParser:
         Returns:
             The heading text as a string
         """
+        # Depth-first walk of the inline tree, keeping only the text leaves
+        # (``RawText``, ``CodeSpan``, ...) whose ``children`` is a string.
+        # Every Marko element has ``children``, so look it up directly and
+        # only fall back to ``str()`` for anything unexpected.
         text_parts = []
-        for child in heading_element.children:
-            if hasattr(child, "children"):
-                # Recursively extract text from nested children
-                if isinstance(child.children, str):
-                    text_parts.append(child.children)
-                elif isinstance(child.children, list):
-                    # Handle list of children recursively
-                    for grandchild in child.children:
-                        if hasattr(grandchild, "children"):
-                            if isinstance(grandchild.children, str):
-                                text_parts.append(grandchild.children)
-                            else:
-                                # For complex nested structures, try to get string representation
-                                text_parts.append(str(grandchild))
-                        else:
-                            text_parts.append(str(grandchild))
-                else:
-                    text_parts.append(str(child.children))
+        stack = [heading_element]
+        while stack:
+            node = stack.pop()
+            try:
+                children = node.children
+            except AttributeError:
+                text_parts.append(str(node))
+                continue
+            if isinstance(children, str):
+                text_parts.append(children)
             else:
-                # Direct text content
-                text_parts.append(str(child))
+                stack.extend(reversed(children))
 
         return "".join(text_parts)
 
@@ -201,7 +271,7 @@ class MarkoOutlineParser:
         self, children: List[Any], start_idx: int, end_idx: int
     ) -> MarkoContentBlock:
         """
-        Extract content between two indices and convert to markdown.
+        Extract content between two indices as a lazily rendered block.
 
         Args:
             children: List of document children
@@ -214,17 +284,12 @@ class MarkoOutlineParser:
         if start_idx >= end_idx:
             return MarkoContentBlock("", start_idx + 1, end_idx)
 
-        # Extract elements and create a document
-        content_elements = children[start_idx:end_idx]
-        content_doc = Document()
-        content_doc.children = content_elements
-
-        # Render to markdown
-        renderer = MarkdownRenderer()
-        content = renderer.render(content_doc)
-
+        # Rendering back to markdown is deferred until the content is used
         return MarkoContentBlock(
-            content=content, start_line=start_idx + 1, end_line=end_idx
+            None,
+            start_line=start_idx + 1,
+            end_line=end_idx,
+            elements=children[start_idx:end_idx],
         )
 
     def _parse_chapter_heading(
@@ -243,17 +308,19 @@ class MarkoOutlineParser:
         heading_text = self._extract_heading_text(heading_element)
 
         # Determine heading type and folder name
-        if heading_text.startswith("Prologue"):
+        match = CHAPTER_HEADING_KIND_PATTERN.match(heading_text)
+        kind = match.lastgroup if match else None
+        if kind == "prologue":
             heading_type = MarkoHeadingType.PROLOGUE
             folder_name = "prologue"
-        elif heading_text.startswith("Introduction"):
+        elif kind == "introduction":
             heading_type = MarkoHeadingType.INTRODUCTION
             folder_name = "introduction"
-        elif match := self._chapter_pattern.match(heading_text):
+        elif kind == "chapter":
             heading_type = MarkoHeadingType.CHAPTER
-            chapter_num = int(match.group(1))
+            chapter_num = int(match.group("chapter"))
             folder_name = f"chapter{chapter_num}"
-        elif heading_text.startswith("Appendix "):
+        elif kind == "appendix":
             heading_type = MarkoHeadingType.APPENDIX
             appendix_part = heading_text[9:]  # Remove "Appendix " prefix
 
@@ -302,8 +369,14 @@ class MarkoOutlineParser:
         """
         heading_text = self._extract_heading_text(heading_element)
 
-        # Check if it's a numbered section
-        match = self._section_pattern.match(heading_text)
+        # Check if it's a numbered section.  SECTION_PATTERN can only match
+        # text starting with a digit, or with a letter followed by a dot, so
+        # check that first to skip the regex for unnumbered content headings
+        # such as "Learning Goals".
+        if heading_text[:1].isdecimal() or heading_text[1:2] == ".":
+            match = SECTION_PATTERN.match(heading_text)
+        else:
+            match = None
 
         if match:
             # This is a numbered section - it gets its own file
@@ -315,12 +388,14 @@ class MarkoOutlineParser:
                 title=section_title,
                 number=section_num,
                 content=MarkoContentBlock("", line_idx + 1, line_idx + 1),
-                filename=self._sanitize_filename(section_title),
+                filename=_sanitize_filename(section_title),
                 section_type="numbered",
             )
 
-            # If this is the first numbered section, extract chapter content
-            if not any(s.section_type == "numbered" for s in chapter.sections):
+            # If this is the first numbered section, extract chapter content.
+            # Only numbered sections are ever added to ``chapter.sections``, so
+            # this is the case exactly when it is still empty.
+            if not chapter.sections:
                 self._extract_chapter_content_before_section(
                     children, chapter, line_idx
                 )
@@ -349,7 +424,11 @@ class MarkoOutlineParser:
         chapter.content = content
 
     def _finalize_chapter(
-        self, children: List[Any], chapter: MarkoChapter, end_idx: int
+        self,
+        children: List[Any],
+        chapter: MarkoChapter,
+        end_idx: int,
+        heading_breaks: list[int],
     ) -> None:
         """
         Finalize a chapter by extracting any remaining content.
@@ -358,6 +437,9 @@ class MarkoOutlineParser:
             children: List of all document children
             chapter: Chapter to finalize
             end_idx: Index where chapter content ends
+            heading_breaks: Sorted indices of the H1-H3 headings in ``children``
+                up to at least ``end_idx``
+
         """
         # If chapter has no sections, extract all content to the end
         if not chapter.sections:
@@ -371,38 +453,13 @@ class MarkoOutlineParser:
                 if section.content.start_line == section.content.end_line:
                     # Section content hasn't been extracted yet
                     # Find the next chapter or section heading (H2 or H3), or end of chapter
+                    # H4+ headings should be included in the section content
+                    pos = bisect_left(heading_breaks, section.content.start_line)
                     section_end = end_idx
-                    for i in range(section.content.start_line, end_idx):
-                        if i < len(children) and isinstance(children[i], Heading):
-                            # Only stop at H2 (chapter) or H3 (section) headings
-                            # H4+ headings should be included in the section content
-                            if children[i].level <= 3:
-                                section_end = i
-                                break
+                    if pos < len(heading_breaks):
+                        section_end = min(heading_breaks[pos], end_idx)
 
                     section_content = self._extract_content_block(
                         children, section.content.start_line - 1, section_end
                     )
                     section.content = section_content
-
-    def _sanitize_filename(self, title: str) -> str:
-        """
-        Convert section title to a safe filename.
-
-        Args:
-            title: Section title to convert
-
-        Returns:
-            Safe filename with .rst extension
-        """
-        # Remove or replace problematic characters
-        filename = re.sub(r"[^\w\s-]", "", title)
-        filename = re.sub(r"[-\s]+", "-", filename)
-        filename = filename.strip("-").lower()
-
-        # Ensure it's not empty
-        if not filename:
-            filename = "section"
-
-        # Add .rst extension
-        return f"{filename}.rst"
@@ -7,9 +7,12 @@ required for outline conversion.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
+from array import array
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import marko
 from marko.block import Heading
@@ -19,6 +22,23 @@ from ..models.outline import ValidationError, ValidationResult
 
 #: Canonical regex pattern for section headings (two levels maximum)
 SECTION_HEADING_PATTERN = r"^(\d+\.\d+|[A-Z]\.\d+)(?!\.\d)\s+(.*)"
+#: Regex pattern for validating chapter headings
+CHAPTER_HEADING_PATTERN = re.compile(
+    r"^(Prologue|Introduction|Chapter\s+\d+:|Appendix\s+[A-Z](?:\.[0-9]+)?)"
+)
+#: Classifies a section (H3) heading in one match: group ``section`` for a
+#: numbered section matching :data:`SECTION_HEADING_PATTERN`, group
+#: ``appendix_section`` for a bare appendix section number such as "A.1"
+_SECTION_KIND_RE = re.compile(
+    rf"(?P<section>{SECTION_HEADING_PATTERN})|(?P<appendix_section>^[A-Z]\.\d+$)"
+)
+#: Section numbering nested more than two levels deep in a heading: group
+#: ``chapter`` for chapter sections (e.g. "1.1.1"), group ``appendix`` for
+#: appendix sections (e.g. "A.1.1")
+_DEEP_SECTION_RE = re.compile(
+    r"^#+\s*(?:(?P<chapter>\d+\.\d+\.\d+)|(?P<appendix>[A-Z]\.\d+\.\d+))",
+    re.MULTILINE,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -42,12 +62,10 @@ class OutlineValidator:
         Initialize the outline validator.
 
         Sets up regex patterns for validating different types of headings
-        in markdown files.
+        in markdown files.  The patterns are compiled once, at import.
         """
         #: Regex pattern for validating chapter headings
-        self._chapter_pattern = re.compile(
-            r"^(Prologue|Introduction|Chapter\s+\d+:|Appendix\s+[A-Z](?:\.[0-9]+)?)"
-        )
+        self._chapter_pattern = CHAPTER_HEADING_PATTERN
 
     def validate_file(self, file_path: Path) -> ValidationResult:
         """
@@ -82,9 +100,30 @@ class OutlineValidator:
             msg = f"Failed to read markdown file: {e!s}"
             raise FileError(msg) from e
 
+        return self.validate_text(content)
+
+    def validate_text(
+        self, content: str, markdown_doc: Element | None = None
+    ) -> ValidationResult:
+        """
+        Validate markdown text for outline structure.
+
+        Use this instead of :meth:`validate_file` when the caller has already
+        read the file, e.g. to share a single read with the outline parser.
+
+        Args:
+            content: The markdown text to validate
+            markdown_doc: ``content`` already parsed by Marko, if the caller
+                has it, e.g. to share a single parse with the outline parser
+
+        Returns:
+            ValidationResult with validation status and any errors/warnings
+
+        """
         try:
-            # Parse markdown with Marko
-            markdown_doc = marko.parse(content)
+            # Parse markdown with Marko, unless the caller already has
+            if markdown_doc is None:
+                markdown_doc = marko.parse(content)
 
             errors = []
 
@@ -133,41 +172,48 @@ class OutlineValidator:
             and chapters as required by the outline structure.
 
         """
-        errors = []
-
-        # Check for section numbering with more than two levels
-        # Pattern for chapters: 1.1.1, 2.3.4, etc.
-        deep_chapter_sections = re.finditer(
-            r"^#+\s*(\d+\.\d+\.\d+)", content, re.MULTILINE
-        )
-        for match in deep_chapter_sections:
-            errors.append(  # noqa: PERF401
-                ValidationError(
-                    line_number=content[: match.start()].count("\n") + 1,
-                    message=(
-                        f"Section numbering '{match.group(1)}' exceeds maximum of "
-                        "two levels. Do not number section headings within chapters.'"
-                    ),
-                    severity="error",
+        # Check for section numbering with more than two levels, for chapters
+        # (1.1.1, 2.3.4, etc.) and appendices (A.1.1, B.2.3, etc.) in a single
+        # scan.  Chapter errors are still reported before appendix errors.
+        chapter_errors = []
+        appendix_errors = []
+
+        # Matches come in document order, so line numbers are kept up to date
+        # by counting only the newlines since the previous match
+        line_number = 1
+        position = 0
+        for match in _DEEP_SECTION_RE.finditer(content):
+            start = match.start()
+            line_number += content.count("\n", position, start)
+            position = start
+            if match.lastgroup == "chapter":
+                chapter_errors.append(
+                    ValidationError(
+                        line_number=line_number,
+                        message=(
+                            f"Section numbering '{match.group('chapter')}' exceeds "
+                            "maximum of two levels. Do not number section headings "
+                            "within chapters.'"
+                        ),
+                        severity="error",
+                    )
                 )
-            )
-
-        # Pattern for appendices: A.1.1, B.2.3, etc.
-        deep_appendix_sections = re.finditer(
-            r"^#+\s*([A-Z]\.\d+\.\d+)", content, re.MULTILINE
-        )
-        for match in deep_appendix_sections:
-            errors.append(
-                ValidationError(
-                    line_number=content[: match.start()].count("\n") + 1,
-                    message=f"Appendix section numbering '{match.group(1)}' exceeds maximum of two levels. Use format 'X.Y' instead of 'X.Y.Z'",
-                    severity="error",
+            else:
+                appendix_errors.append(
+                    ValidationError(
+                        line_number=line_number,
+                        message=(
+                            f"Appendix section numbering '{match.group('appendix')}' "
+                            "exceeds maximum of two levels. Use format 'X.Y' instead "
+                            "of 'X.Y.Z'"
+                        ),
+                        severity="error",
+                    )
                 )
-            )
 
-        return errors
+        return chapter_errors + appendix_errors
 
-    @dataclass
+    @dataclass(slots=True)
     class _ValidationState:
         """
         Internal class to hold validation state during heading structure validation.
@@ -181,7 +227,13 @@ class OutlineValidator:
 
         """
 
-        headings: list[tuple[int, str, Any]] = field(default_factory=list)
+        #: Level of each heading, in document order
+        levels: array[int] = field(default_factory=lambda: array("B"))
+        #: Text of each heading, parallel to ``levels``
+        texts: list[str] = field(default_factory=list)
+        #: For each heading, the text of the closest chapter
+        #: heading (H2) before it, or ``None`` if there isn't one
+        parent_chapters: list[str | None] = field(default_factory=list)
         errors: list[ValidationError] = field(default_factory=list)
         current_index: int = 0
 
@@ -214,7 +266,7 @@ class OutlineValidator:
         self._extract_headings(markdown_doc, state)
 
         # Check for basic document structure
-        if not state.headings:
+        if not state.texts:
             state.errors.append(
                 ValidationError(
                     line_number=1,
@@ -225,8 +277,7 @@ class OutlineValidator:
             return state.errors
 
         # Validate heading hierarchy and patterns
-        self._validate_heading_hierarchy(state)
-        self._validate_heading_patterns(state)
+        self._validate_headings(state)
 
         return state.errors
 
@@ -234,8 +285,8 @@ class OutlineValidator:
         """
         Extract all headings from the parsed markdown document.
 
-        Safely extracts heading information including level, text content,
-        and element reference from the Marko AST.
+        Safely extracts the level and text content of each heading from the
+        Marko AST.
 
         Args:
             markdown_doc: Parsed markdown document from Marko
@@ -246,10 +297,19 @@ class OutlineValidator:
             from Marko heading elements, which can have nested structure.
 
         """
+        # Marko has no ``Heading`` subclasses (``SetextHeading`` is unrelated),
+        # so an exact type check is equivalent to ``isinstance`` and cheaper
+        heading_cls = Heading
+        # The most recent chapter heading (H2) seen so far
+        chapter_text = None
         for element in markdown_doc.children:  # type: ignore[attr-defined]
-            if isinstance(element, Heading):
+            if type(element) is heading_cls:
                 heading_text = self._extract_heading_text(element)
-                state.headings.append((element.level, heading_text, element))
+                state.levels.append(element.level)
+                state.texts.append(heading_text)
+                state.parent_chapters.append(chapter_text)
+                if element.level == 2:  # noqa: PLR2004
+                    chapter_text = heading_text
 
     def _extract_heading_text(self, heading_element: Heading) -> str:
         """
@@ -273,9 +333,14 @@ class OutlineValidator:
             children = getattr(heading_element, "children", [])
             if children and len(children) > 0:
                 first_child = children[0]
-                if hasattr(first_child, "children"):
+                grandchildren = getattr(first_child, "children", None)
+                if isinstance(grandchildren, str):
+                    # The common case: a plain text leaf such as ``RawText``
+                    # holds its text directly, so there is nothing to join
+                    return grandchildren
+                if grandchildren is not None:
                     # If it has children, join them to get the text
-                    return "".join(str(child) for child in first_child.children)
+                    return "".join([str(child) for child in grandchildren])
                 # Otherwise use the string representation
                 return str(first_child)
             return str(heading_element)
@@ -283,68 +348,60 @@ class OutlineValidator:
             # If we can't extract text safely, fall back to string representation
             return str(heading_element)
 
-    def _validate_heading_hierarchy(self, state: _ValidationState) -> None:
+    def _validate_headings(self, state: _ValidationState) -> None:
         """
-        Validate that heading levels follow proper hierarchy.
+        Validate heading hierarchy and patterns in a single pass.
 
-        Ensures that heading levels don't skip levels (e.g., H1 -> H3)
-        and that the document starts with a level 1 heading.
+        Ensures that heading levels don't skip levels (e.g., H1 -> H3) and
+        that the document starts with a level 1 heading, and checks that
+        chapter headings (H2) and section headings (H3) follow the required
+        patterns for the document structure.
 
         Args:
             state: Validation state containing headings and errors
 
         Note:
-            This method checks for proper heading nesting and ensures
-            the document structure follows valid markdown hierarchy rules.
+            Hierarchy errors are reported before pattern errors, just as if
+            the headings had been checked in two separate passes.
 
         """
-        for i, (level, _heading_text, _) in enumerate(state.headings):
-            if i == 0 and level != 1:
-                state.errors.append(
-                    ValidationError(
-                        line_number=1,
-                        message=(
-                            "Document must start with a level 1 heading (book title)"
-                        ),
-                        severity="error",
-                    )
-                )
-            elif i > 0:
-                prev_level = state.headings[i - 1][0]
-                if level > prev_level + 1:
-                    state.errors.append(
+        hierarchy_errors = []
+        prev_level = 0
+        for i, (level, heading_text) in enumerate(zip(state.levels, state.texts)):
+            # Check proper heading nesting
+            if i == 0:
+                if level != 1:
+                    hierarchy_errors.append(
                         ValidationError(
-                            line_number=1,  # Marko doesn't preserve line numbers easily
+                            line_number=1,
                             message=(
-                                f"Invalid heading hierarchy: level {level} heading "
-                                f"cannot follow level {prev_level} heading"
+                                "Document must start with a level 1 heading "
+                                "(book title)"
                             ),
                             severity="error",
                         )
                     )
+            elif level > prev_level + 1:
+                hierarchy_errors.append(
+                    ValidationError(
+                        line_number=1,  # Marko doesn't preserve line numbers easily
+                        message=(
+                            f"Invalid heading hierarchy: level {level} heading "
+                            f"cannot follow level {prev_level} heading"
+                        ),
+                        severity="error",
+                    )
+                )
+            prev_level = level
 
-    def _validate_heading_patterns(self, state: _ValidationState) -> None:
-        """
-        Validate heading patterns based on their level and context.
-
-        Checks that chapter headings (H2) and section headings (H3) follow
-        the required patterns for the document structure.
-
-        Args:
-            state: Validation state containing headings and errors
-
-        Note:
-            This method validates the specific format requirements for
-            different heading levels, including special handling for
-            appendix sections.
-
-        """
-        for i, (level, heading_text, _) in enumerate(state.headings):
+            # Check the format requirements for chapters and sections
             if level == 2:  # noqa: PLR2004
                 self._validate_chapter_heading(heading_text, state)
             elif level == 3:  # noqa: PLR2004
                 self._validate_section_heading(heading_text, i, state)
 
+        state.errors[:0] = hierarchy_errors
+
     def _validate_chapter_heading(
         self, heading_text: str, state: _ValidationState
     ) -> None:
@@ -396,46 +453,86 @@ class OutlineValidator:
             content within the parent chapter).
 
         """
+        # Classify the heading with a single match
+        match = _SECTION_KIND_RE.match(heading_text)
+
         # Check if this is a numbered section heading
-        if re.match(SECTION_HEADING_PATTERN, heading_text):
+        if match and match["section"] is not None:
             # This is a valid numbered section heading
             return
 
-        # Find the parent chapter to determine context
-        parent_chapter = self._find_parent_chapter(heading_index, state)
+        if match:
+            # Find the parent chapter to determine context
+            parent_chapter = state.parent_chapters[heading_index]
 
-        if parent_chapter and parent_chapter.startswith("Appendix "):
-            # Under appendix chapter - allow letter.number pattern (e.g., A.1, B.2)
-            if re.match(r"^[A-Z]\.\d+$", heading_text):
+            if parent_chapter and parent_chapter.startswith("Appendix "):
+                # Under appendix chapter - allow letter.number pattern (e.g., A.1)
                 # This is a valid numbered appendix section heading
                 return
 
         # This is an unnumbered H3 heading - treat as content, not a section
         # No validation needed for content headings
 
-    def _find_parent_chapter(
-        self, heading_index: int, state: _ValidationState
-    ) -> str | None:
-        """
-        Find the parent chapter heading for a given section heading.
 
-        Searches backwards from the current heading to find the most
-        recent chapter heading (H2) that precedes this section.
+#: Maximum number of entries kept in :data:`_validation_cache`
+VALIDATION_CACHE_SIZE = 64
 
-        Args:
-            heading_index: Index of the current heading in the headings list
-            state: Validation state containing all headings
+#: Memoized validation results, keyed on ``(path, mtime_ns, size, digest)``,
+#: where ``digest`` hashes the text passed to :func:`validate_file_cached`,
+#: or is ``None`` if it read the file itself
+_validation_cache: dict[tuple[str, int, int, bytes | None], ValidationResult] = {}
 
-        Returns:
-            The text of the parent chapter heading, or None if not found
 
-        Note:
-            This method is used to determine the context for section
-            validation, particularly for appendix sections which have
-            different validation rules.
+def validate_file_cached(
+    file_path: Path, content: str | None = None, markdown_doc: Element | None = None
+) -> ValidationResult:
+    """
+    Validate a markdown file, reusing the result for an unchanged file.
 
-        """
-        for j in range(heading_index - 1, -1, -1):
-            if state.headings[j][0] == 2:  # noqa: PLR2004
-                return state.headings[j][1]
-        return None
+    This is equivalent to ``OutlineValidator().validate_file(file_path)``, but
+    repeated validation of the same file within a process is free as long as
+    the file's modification time and size are unchanged.  Each call returns
+    its own copy of the result, so callers may modify it freely.
+
+    When ``content`` is given, a hash of it is part of the cache key, so
+    changed text is always revalidated.  Without it, a rewrite that keeps
+    the file's size within the filesystem's timestamp granularity may get
+    the stale result; pass ``content`` if that matters.
+
+    Args:
+        file_path: Path to the markdown file to validate
+        content: The file's text, if the caller has already read it
+        markdown_doc: ``content`` already parsed by Marko, if the caller has
+            it.  Only used together with ``content``.
+
+    Returns:
+        ValidationResult with validation status and any errors/warnings
+
+    Raises:
+        FileError: If the file cannot be read
+
+    """
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        msg = f"Failed to read markdown file: {e!s}"
+        raise FileError(msg) from e
+    digest = (
+        None
+        if content is None
+        else hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    )
+    key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size, digest)
+
+    result = _validation_cache.get(key)
+    if result is None:
+        validator = OutlineValidator()
+        if content is None:
+            result = validator.validate_file(file_path)
+        else:
+            result = validator.validate_text(content, markdown_doc)
+        if len(_validation_cache) >= VALIDATION_CACHE_SIZE:
+            # Evict the oldest entry
+            del _validation_cache[next(iter(_validation_cache))]
+        _validation_cache[key] = result
+    return copy.deepcopy(result)
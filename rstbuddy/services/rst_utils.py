@@ -7,29 +7,189 @@ that are still useful for the new Marko-based outline-to-rst approach.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import os
 import re
 import shutil
 import subprocess
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime
-from pathlib import Path
+from itertools import chain, zip_longest
 from typing import TYPE_CHECKING
 
 from rstbuddy.exc import FileError
 from rstbuddy.services.pandoc_converter import get_pandoc_installation_instructions
+from rstbuddy.settings import user_cache_dir
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
     from ..models.outline import BookOutline, Chapter, Section
 
+#: Separator placed between markdown documents sent to, and RST documents read
+#: back from, :data:`PANDOC_BATCH_SCRIPT` (the ASCII record separator).
+PANDOC_BATCH_SEPARATOR = "\x1e"
+
+#: Lua program run with ``pandoc lua`` by :func:`convert_contents_to_rst`.  It
+#: reads markdown documents separated by :data:`PANDOC_BATCH_SEPARATOR` from
+#: stdin and writes their RST conversions to stdout, separated the same way.
+#: Each document is read and written independently, so the output is the same
+#: as running ``pandoc -f markdown -t rst`` once per document.
+PANDOC_BATCH_SCRIPT = """
+local sep = "\\30"
+local out = {}
+for chunk in (io.read("a") .. sep):gmatch("(.-)" .. sep) do
+  out[#out + 1] = pandoc.write(pandoc.read(chunk, "markdown"), "rst")
+end
+io.write(table.concat(out, sep))
+"""
+
+#: Markdown heading prefixes recognized by :func:`filter_section_heading`
+_MARKDOWN_HEADING_PREFIXES = ("### ", "## ", "# ")
+#: A setext-style underline made of dashes
+_DASH_UNDERLINE_PATTERN = re.compile(r"-+")
+#: Chapter title prefixes removed by :func:`get_clean_chapter_title`.  For
+#: "Chapter " and "Appendix " everything up to the first colon, if there is
+#: one, is part of the prefix.
+_CHAPTER_TITLE_PREFIX_PATTERN = re.compile(
+    r"(?:(?P<kind>Chapter |Appendix )(?:[^:]*:)?|(?:Introduction|Prologue): )"
+    r"(?P<title>.*)",
+    re.DOTALL,
+)
+#: Numbered section title, e.g. "1.1 Installation" or "A.2 Glossary"; group 2
+#: is the title without its number
+_SECTION_NUMBER_PATTERN = re.compile(r"^(\d+\.\d+|[A-Z]\.\d+)\s+(.*)")
+
+#: Bump this whenever the RST stored in the persistent Pandoc cache would be
+#: produced differently (e.g. a change to :func:`remove_pandoc_anchors`), so
+#: that stale entries are ignored.
+PANDOC_CACHE_VERSION = 1
+
+#: :meth:`~datetime.datetime.strftime` format of the timestamp in backup file
+#: names
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def pandoc_cache_dir() -> Path:
+    """
+    Return the directory used for the persistent Pandoc conversion cache.
+
+    Returns:
+        The ``pandoc`` directory under :func:`~rstbuddy.settings.user_cache_dir`
+        (which may not exist yet)
+
+    """
+    return user_cache_dir() / "pandoc"
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_identity(search_path: str | None) -> str | None:
+    """
+    Identify the ``pandoc`` on ``search_path`` for persistent cache keys.
+
+    Args:
+        search_path: The ``PATH`` to search; part of the cache key so that a
+            changed ``PATH`` is looked up again
+
+    Returns:
+        The path, size and modification time of the ``pandoc`` executable, or
+        ``None`` if Pandoc is not installed
+
+    """
+    pandoc_path = shutil.which("pandoc", path=search_path)
+    if pandoc_path is None:
+        return None
+    try:
+        stat = os.stat(pandoc_path)  # noqa: PTH116
+    except OSError:
+        return None
+    return f"{pandoc_path}\0{stat.st_size}\0{stat.st_mtime_ns}"
+
+
+def _pandoc_cache_path(markdown_content: str) -> Path | None:
+    """
+    Return the persistent cache file for a markdown block.
+
+    The key covers the markdown itself and the identity of the ``pandoc`` on
+    ``PATH`` (see :func:`_pandoc_identity`), so upgrading Pandoc invalidates
+    the cache.
+
+    Args:
+        markdown_content: The markdown block
+
+    Returns:
+        Path to the cached RST, or ``None`` if Pandoc is not installed
+
+    """
+    identity = _pandoc_identity(os.environ.get("PATH"))
+    if identity is None:
+        return None
+    digest = hashlib.blake2b(
+        f"{PANDOC_CACHE_VERSION}\0{identity}\0".encode(), digest_size=16
+    )
+    digest.update(markdown_content.encode("utf-8"))
+    return pandoc_cache_dir() / f"{digest.hexdigest()}.rst"
+
+
+def load_cached_rst(markdown_content: str) -> str | None:
+    """
+    Look up a markdown block in the persistent Pandoc cache.
+
+    Args:
+        markdown_content: The markdown block
+
+    Returns:
+        The cached RST conversion, or ``None`` if there is no usable entry
+
+    """
+    cache_path = _pandoc_cache_path(markdown_content)
+    if cache_path is None:
+        return None
+    try:
+        return cache_path.read_bytes().decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def store_cached_rst(markdown_content: str, rst_content: str) -> None:
+    """
+    Save a markdown block's RST conversion to the persistent Pandoc cache.
+
+    The entry is written atomically by :func:`write_file_bytes`, so
+    concurrent runs never see a partial entry.  Failures are ignored; caching
+    is only an optimization.
+
+    Args:
+        markdown_content: The markdown block
+        rst_content: Its RST conversion
+
+    """
+    cache_path = _pandoc_cache_path(markdown_content)
+    if cache_path is None:
+        return
+    with suppress(OSError):
+        write_file_bytes(cache_path, rst_content.encode("utf-8"), make_parents=True)
+
 
-def content_is_different(file_path: Path, new_content: str) -> bool:
+def content_is_different(  # noqa: PLR0911
+    file_path: Path,
+    new_content: str,
+    written_hashes: dict[Path, bytes] | None = None,
+) -> bool:
     """
     Check if new content differs from existing file content.
 
     Args:
         file_path: Path to the file to compare
         new_content: New content to compare against existing file
+        written_hashes: Optional digests of the normalized content of files
+            already written or checked by :func:`backup_and_write_file` in
+            this process.  If ``file_path`` is in it, the digests are
+            compared instead of reading the file.
 
     Returns:
         True if content is different, False if identical
@@ -37,24 +197,93 @@ def content_is_different(file_path: Path, new_content: str) -> bool:
     Note:
         This method normalizes content by removing trailing whitespace
         and normalizing line endings before comparison.
+
     """
-    if not file_path.exists():
+    if written_hashes is not None and file_path in written_hashes:
+        new_digest = _content_digest(normalize_content(new_content))
+        return written_hashes[file_path] != new_digest
+
+    try:
+        existing_size = file_path.stat().st_size
+    except OSError:
         return True  # File doesn't exist, so it's "different"
 
+    # Normalize both contents for comparison
+    # Remove trailing whitespace and normalize line endings
+    normalized_new = normalize_content(new_content)
+
+    # Normalizing never makes content longer, so a file smaller than the
+    # normalized new content can't match it; skip reading it
+    if existing_size < len(normalized_new.encode("utf-8")):
+        return True
+
+    # A file the same size as what we'd write is most likely one we wrote
+    # before, unchanged.  Compare the raw bytes first, so that case needs no
+    # decoding or normalizing; the bytes are only decoded if they differ.
+    new_bytes = encode_text_file(new_content)
+    if existing_size == len(new_bytes):
+        try:
+            existing_bytes = file_path.read_bytes()
+            if existing_bytes == new_bytes:
+                return False
+            existing_content = existing_bytes.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            # If we can't read the existing file, assume it's different
+            return True
+        return normalize_content(existing_content) != normalized_new
+
     try:
         with file_path.open(encoding="utf-8") as f:
-            existing_content = f.read()
-
-        # Normalize both contents for comparison
-        # Remove trailing whitespace and normalize line endings
-        normalized_existing = normalize_content(existing_content)
-        normalized_new = normalize_content(new_content)
+            # Compare line by line so we stop reading at the first difference.
+            # An empty file normalizes to "" just like a single blank line, so
+            # treat it as one, matching ``"".split("\n")`` on the new side.
+            existing_lines = _normalized_lines(f)
+            first_line = next(existing_lines, "")
+            for existing, new in zip_longest(
+                chain((first_line,), existing_lines), normalized_new.split("\n")
+            ):
+                if existing != new:
+                    return True
 
     except (OSError, UnicodeDecodeError):
         # If we can't read the existing file, assume it's different
         return True
     else:
-        return normalized_existing != normalized_new
+        return False
+
+
+def _normalized_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the lines of :func:`normalize_content` for text read line by line.
+
+    File iteration only splits on newlines and carriage returns, while
+    :meth:`str.splitlines` also splits on other boundaries such as form feeds,
+    so each line read is split again to match.
+
+    Args:
+        lines: Lines of text, e.g. an open text file
+
+    Yields:
+        Each line with its trailing whitespace removed
+
+    """
+    for line in lines:
+        for part in line.splitlines():
+            yield part.rstrip()
+
+
+def _content_digest(normalized_content: str) -> bytes:
+    """
+    Hash normalized file content for :func:`content_is_different`.
+
+    Args:
+        normalized_content: Content as returned by :func:`normalize_content`
+
+    Returns:
+        A BLAKE2b digest of the content
+
+    """
+    return hashlib.blake2b(normalized_content.encode("utf-8"), digest_size=16).digest()
 
 
 def normalize_content(content: str) -> str:
@@ -67,6 +296,7 @@ def normalize_content(content: str) -> str:
 
     Returns:
         Normalized content with consistent formatting
+
     """
     # Split into lines, strip trailing whitespace, and rejoin
     lines = content.splitlines()
@@ -74,29 +304,62 @@ def normalize_content(content: str) -> str:
     return "\n".join(normalized_lines)
 
 
-def backup_file_if_exists(file_path: Path, dry_run: bool = False) -> None:
+def backup_timestamp() -> str:
+    """
+    Return the current time formatted for use in backup file names.
+
+    Returns:
+        The timestamp, in :data:`BACKUP_TIMESTAMP_FORMAT`
+
+    """
+    return datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)  # noqa: DTZ005
+
+
+def backup_file_if_exists(
+    file_path: Path, dry_run: bool = False, timestamp: str | None = None
+) -> None:
     """
     Backup a single file if it exists, using timestamped naming.
 
     Args:
         file_path: Path to the file to backup
         dry_run: If True, only show what would be done
+        timestamp: Timestamp to name the backup with, so that all the backups
+            made by one run share it.  Defaults to :func:`backup_timestamp`.
 
     Note:
-        Creates a backup with format: filename.timestamp.bak
+        Creates a backup with format: filename.timestamp.bak.  Where the
+        filesystem allows it, the backup is a hard link to the file, so the
+        file must only be replaced afterwards (as :func:`write_file_bytes`
+        does), never modified in place.
+
     """
     if file_path.exists():
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")  # noqa: DTZ005
+        if timestamp is None:
+            timestamp = backup_timestamp()
         backup_path = file_path.with_suffix(f".{timestamp}.bak")
         if dry_run:
             print(f"[DRY RUN] Would backup: {file_path} -> {backup_path}")
         else:
-            shutil.copy2(file_path, backup_path)
+            # A hard link costs one metadata operation instead of copying the
+            # file.  It stays an intact backup because write_file_bytes()
+            # replaces the file with a new one rather than writing into it.
+            try:
+                os.link(file_path, backup_path)
+            except OSError:
+                # No hard link support, or the backup already exists
+                shutil.copy2(file_path, backup_path)
             print(f"Backed up: {file_path} -> {backup_path}")
 
 
-def backup_and_write_file(
-    file_path: Path, new_content: str, force: bool = False, dry_run: bool = False
+def backup_and_write_file(  # noqa: PLR0913
+    file_path: Path,
+    new_content: str,
+    force: bool = False,
+    dry_run: bool = False,
+    *,
+    written_hashes: dict[Path, bytes] | None = None,
+    backup_timestamp: str | None = None,
 ) -> None:
     """
     Backup existing file and write new content only if different.
@@ -112,14 +375,24 @@ def backup_and_write_file(
         new_content: New content to write to the file
         force: If True, create backups of existing files
         dry_run: If True, only show what would be done
+        written_hashes: Optional cache of content digests, keyed by path.
+            After the file is written, or found to be unchanged, the digest of
+            its normalized content is stored here so that writing the same
+            path again doesn't need to read it back; see
+            :func:`content_is_different`
+        backup_timestamp: Timestamp to name the backup with; see
+            :func:`backup_file_if_exists`
 
     Raises:
         OSError: If file operations fail (read, write, backup)
         UnicodeDecodeError: If existing file cannot be read with UTF-8 encoding
+
     """
     # Check if content is different
-    if not content_is_different(file_path, new_content):
+    if not content_is_different(file_path, new_content, written_hashes):
         print(f"Skipping {file_path} - content unchanged")
+        if written_hashes is not None:
+            written_hashes[file_path] = _content_digest(normalize_content(new_content))
         return
 
     # Content is different, so backup and write
@@ -127,20 +400,105 @@ def backup_and_write_file(
         if dry_run:
             print(f"[DRY RUN] Would backup: {file_path}")
         else:
-            backup_file_if_exists(file_path, dry_run)
+            backup_file_if_exists(file_path, dry_run, backup_timestamp)
 
     # Write the new content
     if dry_run:
         print(f"[DRY RUN] Would update: {file_path}")
     else:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with file_path.open("w", encoding="utf-8") as f:
-            f.write(new_content)
+        write_file_bytes(file_path, encode_text_file(new_content), make_parents=True)
+        if written_hashes is not None:
+            written_hashes[file_path] = _content_digest(normalize_content(new_content))
         print(f"Updated: {file_path}")
 
 
+def encode_text_file(content: str) -> bytes:
+    """
+    Encode text the way writing it to a text-mode file would.
+
+    Args:
+        content: The text to encode
+
+    Returns:
+        The UTF-8 encoded text, with newlines translated to :data:`os.linesep`
+
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
+
+def write_file_bytes(
+    file_path: Path, data: bytes, *, make_parents: bool = False
+) -> None:
+    """
+    Atomically write ``data`` to ``file_path``, replacing any existing content.
+
+    The data is written to a temporary file next to ``file_path``, which is
+    then renamed over it with :meth:`Path.replace`, so an interrupted run never
+    leaves a half-written file behind.  The temporary file is named for the
+    process and thread, so concurrent writers of the same path don't collide.
+    This goes straight to :func:`os.open` and :func:`os.write`, bypassing the
+    buffered text I/O layers that :meth:`Path.open` would set up for what is a
+    single write of an already encoded buffer.
+
+    An existing file keeps its permissions, and if ``file_path`` is a symlink
+    the file it points to is replaced, not the link.  Because the file is
+    replaced rather than written in place, other hard links to it keep the old
+    content; :func:`backup_file_if_exists` relies on this.
+
+    Args:
+        file_path: Path of the file to write
+        data: The bytes to write
+
+    Keyword Args:
+        make_parents: If True, create any missing parent directories.  They
+            are only created if opening the file fails because they are
+            missing, so the common case costs no extra system calls.
+
+    Raises:
+        OSError: If the file cannot be opened, written or renamed
+
+    """
+    if file_path.is_symlink():
+        # Write through the link instead of replacing it with a regular file
+        file_path = file_path.resolve()
+    try:
+        mode: int | None = file_path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    tmp_path = file_path.with_name(
+        f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+    except FileNotFoundError:
+        if not make_parents:
+            raise
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, flags, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        if mode is not None:
+            # The temporary file was created with the default permissions
+            tmp_path.chmod(mode)
+        tmp_path.replace(file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def convert_content_to_rst(
-    markdown_content: str, content_cache: dict[str, str] | None = None
+    markdown_content: str,
+    content_cache: dict[str, str] | None = None,
+    *,
+    persistent_cache: bool = False,
 ) -> str:
     """
     Convert Markdown content to RST using Pandoc.
@@ -153,20 +511,22 @@ def convert_content_to_rst(
         markdown_content: Markdown content to convert
         content_cache: Optional cache for pandoc conversions
 
+    Keyword Args:
+        persistent_cache: If True, also look the content up in, and save the
+            result to, the on-disk cache in :func:`pandoc_cache_dir`
+
     Returns:
         RST-formatted content
 
     Raises:
-        subprocess.CalledProcessError: If pandoc command fails
-        FileError: If any of the file operations fail
-        FileNotFoundError: If pandoc executable is not found
+        FileError: If Pandoc is not installed or the conversion fails
 
     Note:
-        - Uses temporary files for Pandoc conversion
+        - Pipes the content through Pandoc's stdin and stdout
         - Caches results to ensure consistent output
         - Raises FileError if Pandoc conversion fails
         - Provides helpful installation instructions if Pandoc is not available
-        - Handles file operation errors gracefully
+
     """
     if not markdown_content.strip():
         return ""
@@ -179,85 +539,151 @@ def convert_content_to_rst(
     if markdown_content in content_cache:
         return content_cache[markdown_content]
 
-    try:
-        # Create a temporary file with the markdown content
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False, encoding="utf-8"
-        ) as temp_md:
-            temp_md.write(markdown_content)
-            temp_md_path = Path(temp_md.name)
-    except OSError as e:
-        msg = f"Failed to create temporary file: {e}"
-        raise FileError(msg) from e
-
-    try:
-        # Create a temporary file for the RST output
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".rst", delete=False, encoding="utf-8"
-        ) as temp_rst:
-            temp_rst_path = Path(temp_rst.name)
-    except OSError as e:
-        with suppress(OSError):
-            temp_md_path.unlink()
-            temp_rst_path.unlink()
-        msg = f"Failed to create temporary file: {e}"
-        raise FileError(msg) from e
+    if persistent_cache:
+        rst_content = load_cached_rst(markdown_content)
+        if rst_content is not None:
+            content_cache[markdown_content] = rst_content
+            return rst_content
 
     try:
-        # Run pandoc to convert markdown to RST
-        subprocess.run(
-            [
-                "pandoc",
-                "-f",
-                "markdown",
-                "-t",
-                "rst",
-                str(temp_md_path),
-                "-o",
-                str(temp_rst_path),
-            ],
+        # Run pandoc to convert markdown to RST, piping through stdin/stdout
+        result = subprocess.run(
+            ["pandoc", "-f", "markdown", "-t", "rst"],
+            input=markdown_content,
             capture_output=True,
             text=True,
+            encoding="utf-8",
             check=True,
         )
     except subprocess.CalledProcessError as e:
-        with suppress(OSError):
-            temp_md_path.unlink()
-            temp_rst_path.unlink()
         msg = f"Pandoc conversion failed: {e}"
+        if e.stderr:
+            msg = f"{msg}\n{e.stderr.strip()}"
         raise FileError(msg) from e
     except FileNotFoundError as e:
-        with suppress(OSError):
-            temp_md_path.unlink()
-            temp_rst_path.unlink()
         instructions = get_pandoc_installation_instructions()
         msg = f"Pandoc is not installed or not found in PATH.\n\n{instructions}"
         raise FileError(msg) from e
-
-    try:
-        # Read the converted RST content
-        with temp_rst_path.open(encoding="utf-8") as f:
-            rst_content = f.read()
-    except OSError as e:
-        with suppress(OSError):
-            temp_md_path.unlink()
-            temp_rst_path.unlink()
-        msg = f"Failed to read converted RST content: {e}"
-        raise FileError(msg) from e
-    finally:
-        # Clean up temporary files
-        with suppress(OSError):
-            temp_md_path.unlink()
-            temp_rst_path.unlink()
+    rst_content = result.stdout
 
     # Post-process RST content to remove auto-generated Pandoc anchors
     rst_content = remove_pandoc_anchors(rst_content)
 
     # Cache the result
     content_cache[markdown_content] = rst_content
+    if persistent_cache:
+        store_cached_rst(markdown_content, rst_content)
     return rst_content
 
 
+def convert_contents_to_rst(
+    markdown_contents: Iterable[str],
+    content_cache: dict[str, str],
+    *,
+    persistent_cache: bool = False,
+) -> None:
+    """
+    Convert many Markdown blocks to RST with a single Pandoc process.
+
+    The results are stored in ``content_cache`` exactly as
+    :func:`convert_content_to_rst` would store them, so later calls to
+    :func:`convert_content_to_rst` for these blocks are plain cache lookups
+    rather than one Pandoc subprocess per block.
+
+    Args:
+        markdown_contents: Markdown blocks to convert
+        content_cache: Cache to populate with the converted RST
+
+    Keyword Args:
+        persistent_cache: If True, take blocks found in the on-disk cache in
+            :func:`pandoc_cache_dir` from there, and save newly converted
+            blocks to it
+
+    Note:
+        This is purely an optimization.  If Pandoc is too old to support
+        ``pandoc lua``, the blocks are converted one process per block, in
+        parallel, instead.  If Pandoc is missing, or a block fails to convert,
+        it is left uncached and :func:`convert_content_to_rst` reports the
+        error when the block is converted.
+
+    """
+    pending = list(
+        dict.fromkeys(
+            content
+            for content in markdown_contents
+            if content.strip() and content not in content_cache
+        )
+    )
+    if persistent_cache:
+        misses = []
+        for markdown_content in pending:
+            rst_content = load_cached_rst(markdown_content)
+            if rst_content is None:
+                misses.append(markdown_content)
+            else:
+                content_cache[markdown_content] = rst_content
+        pending = misses
+    pending = [content for content in pending if PANDOC_BATCH_SEPARATOR not in content]
+    if not pending:
+        return
+
+    try:
+        result = subprocess.run(
+            ["pandoc", "lua", "-e", PANDOC_BATCH_SCRIPT],
+            input=PANDOC_BATCH_SEPARATOR.join(pending),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=True,
+        )
+    except OSError:
+        # Pandoc is missing; convert_content_to_rst will report that
+        return
+    except subprocess.CalledProcessError:
+        # Most likely a Pandoc too old to have ``pandoc lua``
+        _convert_each_to_rst(pending, content_cache, persistent_cache)
+        return
+
+    rst_contents = result.stdout.split(PANDOC_BATCH_SEPARATOR)
+    if len(rst_contents) != len(pending):
+        _convert_each_to_rst(pending, content_cache, persistent_cache)
+        return
+    for markdown_content, rst_content in zip(pending, rst_contents, strict=True):
+        content_cache[markdown_content] = remove_pandoc_anchors(rst_content)
+        if persistent_cache:
+            store_cached_rst(markdown_content, content_cache[markdown_content])
+
+
+def _convert_each_to_rst(
+    markdown_contents: list[str], content_cache: dict[str, str], persistent_cache: bool
+) -> None:
+    """
+    Convert Markdown blocks with one Pandoc process each, run concurrently.
+
+    This is the fallback for :func:`convert_contents_to_rst` when the batch
+    conversion can't be used.  The work is spent waiting on subprocesses, so
+    threads are enough to overlap it.  Blocks that fail to convert are left
+    out of ``content_cache`` so that :func:`convert_content_to_rst` reports
+    the error when the block is actually needed.
+
+    Args:
+        markdown_contents: Markdown blocks to convert
+        content_cache: Cache to populate with the converted RST
+        persistent_cache: Whether to use the on-disk cache
+
+    """
+
+    def convert(markdown_content: str) -> None:
+        with suppress(FileError):
+            convert_content_to_rst(
+                markdown_content, content_cache, persistent_cache=persistent_cache
+            )
+
+    max_workers = min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(convert, markdown_contents))
+
+
 def remove_pandoc_anchors(rst_content: str) -> str:
     """
     Remove auto-generated Pandoc anchors from RST content.
@@ -272,6 +698,7 @@ def remove_pandoc_anchors(rst_content: str) -> str:
 
     Returns:
         RST content with Pandoc anchors removed
+
     """
     if not rst_content.strip():
         return rst_content
@@ -305,30 +732,14 @@ def get_clean_chapter_title(chapter: Chapter) -> str:
 
     Returns:
         Clean chapter title without prefix
+
     """
     title = chapter.title
 
     # Remove common prefixes
-    if title.startswith("Chapter "):
-        # Extract everything after "Chapter X: "
-        if ":" in title:
-            return title.split(":", 1)[1].strip()
-        else:
-            return title[8:].strip()  # Remove "Chapter " prefix
-
-    elif title.startswith("Appendix "):
-        # Extract everything after "Appendix X: "
-        if ":" in title:
-            return title.split(":", 1)[1].strip()
-        else:
-            return title[9:].strip()  # Remove "Appendix " prefix
-
-    elif title.startswith("Introduction: "):
-        return title[13:].strip()  # Remove "Introduction: " prefix
-
-    elif title.startswith("Prologue: "):
-        return title[10:].strip()  # Remove "Prologue: " prefix
-
+    match = _CHAPTER_TITLE_PREFIX_PATTERN.fullmatch(title)
+    if match:
+        return match.group("title").strip()
     return title
 
 
@@ -341,11 +752,10 @@ def get_clean_section_title(title: str) -> str:
 
     Returns:
         Clean section title without number prefix
+
     """
     # Remove section numbering patterns
-    # Match patterns like "1.1", "2.3", "A.1", "B.2"
-    section_pattern = re.compile(r"^(\d+\.\d+|[A-Z]\.\d+)\s+(.*)")
-    match = section_pattern.match(title)
+    match = _SECTION_NUMBER_PATTERN.match(title)
 
     if match:
         return match.group(2).strip()
@@ -363,6 +773,7 @@ def filter_chapter_heading(content: str, chapter_title: str) -> str:
 
     Returns:
         Content with chapter heading filtered out
+
     """
     # Split content into lines
     lines = content.splitlines()
@@ -371,9 +782,10 @@ def filter_chapter_heading(content: str, chapter_title: str) -> str:
     filtered_lines = []
     heading_found = False
 
+    title = chapter_title.strip()
     for line in lines:
         # Skip the exact chapter title line
-        if line.strip() == chapter_title.strip():
+        if line.strip() == title:
             heading_found = True
             continue
 
@@ -397,6 +809,7 @@ def filter_section_heading(content: str, section_title: str) -> str:
 
     Returns:
         Content with section heading filtered out
+
     """
     # Split content into lines
     lines = content.splitlines()
@@ -405,51 +818,41 @@ def filter_section_heading(content: str, section_title: str) -> str:
     filtered_lines = []
     heading_found = False
 
+    # Everything that depends only on the title is worked out once, up front
+    section_title = section_title.strip()
+    clean_title = section_title
+    if clean_title.startswith("#"):
+        # Remove markdown prefix and get clean title
+        clean_title = clean_title.lstrip("#").strip()
+    heading_lines = frozenset(
+        (
+            section_title,
+            clean_title,
+            f"### {clean_title}",
+            f"## {clean_title}",
+            f"# {clean_title}",
+        )
+    )
+    numbered_suffix = f" {clean_title}"
+
     for line in lines:
         # Skip the exact section title line (with or without markdown syntax)
         stripped_line = line.strip()
-
-        # Check for exact match first
-        if stripped_line == section_title.strip():
-            heading_found = True
-            continue
-
-        # Check for markdown format matches (### Title, ## Title, # Title)
-        # Extract the clean title from the markdown heading
-        clean_title = section_title.strip()
-        if clean_title.startswith("#"):
-            # Remove markdown prefix and get clean title
-            clean_title = clean_title.lstrip("#").strip()
-
-        # Check for exact matches and various markdown formats
-        if (
-            stripped_line == clean_title
-            or stripped_line == f"### {clean_title}"
-            or stripped_line == f"## {clean_title}"
-            or stripped_line == f"# {clean_title}"
-        ):
+        if stripped_line in heading_lines:
             heading_found = True
             continue
 
         # Check for numbered section headings like "### 2.1 Introduction"
         # This handles cases where the content contains the full numbered heading
         # but we only have the clean title
-        if stripped_line.startswith("### ") and stripped_line.endswith(
-            f" {clean_title}"
-        ):
-            heading_found = True
-            continue
-        if stripped_line.startswith("## ") and stripped_line.endswith(
-            f" {clean_title}"
+        if stripped_line.startswith(_MARKDOWN_HEADING_PREFIXES) and (
+            stripped_line.endswith(numbered_suffix)
         ):
             heading_found = True
             continue
-        if stripped_line.startswith("# ") and stripped_line.endswith(f" {clean_title}"):
-            heading_found = True
-            continue
 
         # Skip the underline line (dashes)
-        if heading_found and re.match(r"^[\-]+$", stripped_line):
+        if heading_found and _DASH_UNDERLINE_PATTERN.fullmatch(stripped_line):
             heading_found = False
             continue
 
@@ -467,28 +870,13 @@ def get_clean_chapter_title_marko(chapter_title: str) -> str:
 
     Returns:
         Clean chapter title without prefix
-    """
-    # Remove common prefixes
-    if chapter_title.startswith("Chapter "):
-        # Extract everything after "Chapter X: "
-        if ":" in chapter_title:
-            return chapter_title.split(":", 1)[1].strip()
-        else:
-            return chapter_title[8:].strip()  # Remove "Chapter " prefix
-
-    elif chapter_title.startswith("Appendix "):
-        # Extract everything after "Appendix X: "
-        if ":" in chapter_title:
-            return chapter_title.split(":", 1)[1].strip()
-        else:
-            return chapter_title[9:].strip()  # Remove "Appendix " prefix
-
-    elif chapter_title.startswith("Introduction: "):
-        return chapter_title  # Keep "Introduction: " prefix
-
-    elif chapter_title.startswith("Prologue: "):
-        return chapter_title  # Keep "Prologue: " prefix
 
+    """
+    # Remove "Chapter X: " and "Appendix X: " prefixes; "Introduction: " and
+    # "Prologue: " titles are kept as they are
+    match = _CHAPTER_TITLE_PREFIX_PATTERN.fullmatch(chapter_title)
+    if match and match.group("kind") in ("Chapter ", "Appendix "):
+        return match.group("title").strip()
     return chapter_title
 
 
@@ -502,6 +890,7 @@ def filter_chapter_heading_marko(content: str, chapter_title: str) -> str:
 
     Returns:
         Content with chapter heading filtered out
+
     """
     # Split content into lines
     lines = content.splitlines()
@@ -510,14 +899,14 @@ def filter_chapter_heading_marko(content: str, chapter_title: str) -> str:
     filtered_lines = []
     heading_found = False
 
+    # The heading line, with or without markdown syntax
+    title = chapter_title.strip()
+    heading_lines = frozenset((title, f"## {title}", f"# {title}"))
+
     for line in lines:
         # Skip the exact chapter title line (with or without markdown syntax)
         stripped_line = line.strip()
-        if (
-            stripped_line == chapter_title.strip()
-            or stripped_line == f"## {chapter_title.strip()}"
-            or stripped_line == f"# {chapter_title.strip()}"
-        ):
+        if stripped_line in heading_lines:
             heading_found = True
             continue
 
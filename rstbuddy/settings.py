@@ -19,6 +19,21 @@ from pydantic_settings import (
 from .exc import ConfigurationError
 
 
+def user_cache_dir() -> Path:
+    """
+    Return the directory rstbuddy keeps its on-disk caches under.
+
+    Honors ``XDG_CACHE_HOME``, falling back to ``~/.cache``.
+
+    Returns:
+        The ``rstbuddy`` cache directory (which may not exist yet)
+
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "rstbuddy"
+
+
 class Settings(BaseSettings):
     """
     Application settings with cascading TOML config file support,
@@ -174,3 +174,31 @@ def reset_console_state():
     # Restore original state
     console.quiet = original_console_quiet
     stderr_console.quiet = original_stderr_console_quiet
+
+
+@pytest.fixture(autouse=True)
+def reset_settings_cache():
+    """Clear the memoized CLI settings so each test sees a fresh load."""
+    from rstbuddy.cli.cli import _load_settings
+
+    _load_settings.cache_clear()
+    yield
+    _load_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_validation_cache():
+    """Clear the memoized outline validation results between tests."""
+    from rstbuddy.services.outline_validator import _validation_cache
+
+    _validation_cache.clear()
+    yield
+    _validation_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path, monkeypatch):
+    """Point ``XDG_CACHE_HOME`` at a per-test directory."""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
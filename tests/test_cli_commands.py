@@ -7,7 +7,7 @@ from __future__ import annotations
 import json
 from unittest.mock import patch
 
-from rstbuddy.cli.cli import cli
+from rstbuddy.cli.cli import _pandoc_version_for, cli
 
 
 class TestCLIVersion:
@@ -30,6 +30,31 @@ class TestCLIVersion:
         result = runner.invoke(cli, ["--quiet", "version"])
         assert result.exit_code == 0
 
+    def test_version_command_with_quiet_skips_table(self, runner):
+        """Test quiet mode doesn't gather version info for a discarded table."""
+        with patch("rstbuddy.cli.cli._pandoc_version") as mock_pandoc_version:
+            result = runner.invoke(cli, ["--quiet", "version"])
+        assert result.exit_code == 0
+        mock_pandoc_version.assert_not_called()
+
+    def test_version_command_without_pandoc(self, runner):
+        """Test the version command still succeeds when pandoc is missing."""
+        with patch("rstbuddy.cli.cli.shutil.which", return_value=None):
+            result = runner.invoke(cli, ["version"])
+        assert result.exit_code == 0
+
+    def test_pandoc_version_is_cached(self):
+        """Test pandoc is only run once for the same binary."""
+        _pandoc_version_for.cache_clear()
+        with patch(
+            "rstbuddy.cli.cli.subprocess.check_output",
+            return_value=b"pandoc 3.1.2\nmore\n",
+        ) as mock_check_output:
+            assert _pandoc_version_for("/usr/bin/pandoc", 1) == "3.1.2"
+            assert _pandoc_version_for("/usr/bin/pandoc", 1) == "3.1.2"
+            assert mock_check_output.call_count == 1
+        _pandoc_version_for.cache_clear()
+
 
 class TestCLISettings:
     """Test the settings command."""
@@ -51,6 +76,14 @@ class TestCLISettings:
         """Test the settings command with text output."""
         result = runner.invoke(cli, ["--output", "text", "settings"])
         assert result.exit_code == 0
+        assert "app_name: rstbuddy\n\n" in result.output
+        assert result.output.endswith("\n\n")
+
+    def test_settings_command_quiet_still_emits_json(self, runner):
+        """Test quiet mode doesn't suppress JSON output."""
+        result = runner.invoke(cli, ["--quiet", "--output", "json", "settings"])
+        assert result.exit_code == 0
+        assert isinstance(json.loads(result.output), dict)
 
     def test_settings_command_with_verbose(self, runner):
         """Test the settings command with verbose flag."""
@@ -127,6 +160,13 @@ class TestCLIErrorHandling:
             # The error is printed to stderr and then sys.exit(1) is called
             # We can verify the exit code indicates an error occurred
 
+    def test_cli_settings_are_cached_between_invocations(self, runner):
+        """Test that Settings is only constructed once for repeated invocations."""
+        with patch("rstbuddy.cli.cli.Settings") as mock_settings:
+            assert runner.invoke(cli, ["version"]).exit_code == 0
+            assert runner.invoke(cli, ["version"]).exit_code == 0
+            assert mock_settings.call_count == 1
+
     def test_cli_context_object_creation(self, runner):
         """Test that CLI context object is properly created."""
         result = runner.invoke(cli, ["version"])
@@ -4,7 +4,10 @@ Tests for the summarize CLI command.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from rstbuddy.cli.cli import cli
+from rstbuddy.exc import ConfigurationError
 
 
 class TestSummarizeCommand:
@@ -41,3 +44,41 @@ class TestSummarizeCommand:
         # Click validates file existence before checking for extra arguments
         assert result.exit_code != 0
         assert "Invalid value for 'RST_FILE'" in result.output
+
+    def test_summarize_command_prints_summary(self, runner, tmp_path):
+        """Test summarize runs end to end with a stubbed summary generator."""
+        rst_file = tmp_path / "doc.rst"
+        rst_file.write_text("Title\n=====\n\nSome text.\n", encoding="utf-8")
+
+        with (
+            patch("rstbuddy.cli.summarize.PandocConverter") as mock_converter,
+            patch("rstbuddy.cli.summarize.SummaryGenerationService") as mock_service,
+        ):
+            mock_converter.return_value.convert_rst_to_md.return_value = "# Title"
+            mock_service.return_value.generate_summary.return_value = "A summary."
+            result = runner.invoke(cli, ["summarize", str(rst_file)])
+
+        assert result.exit_code == 0
+        assert "A summary." in result.output
+        mock_converter.return_value.convert_rst_to_md.assert_called_once_with(
+            "Title\n=====\n\nSome text.\n"
+        )
+        mock_service.return_value.generate_summary.assert_called_once_with("# Title")
+
+    def test_summarize_command_summary_failure_exits(self, runner, tmp_path):
+        """Test a failed summary generation exits with status 1."""
+        rst_file = tmp_path / "doc.rst"
+        rst_file.write_text("Some text.\n", encoding="utf-8")
+
+        with (
+            patch("rstbuddy.cli.summarize.PandocConverter") as mock_converter,
+            patch("rstbuddy.cli.summarize.SummaryGenerationService") as mock_service,
+        ):
+            mock_converter.return_value.convert_rst_to_md.return_value = "Some text."
+            mock_service.return_value.generate_summary.side_effect = ConfigurationError(
+                "no API key"
+            )
+            result = runner.invoke(cli, ["summarize", str(rst_file)])
+
+        assert result.exit_code == 1
+        assert "Summary generation failed: no API key" in result.output
@@ -5,6 +5,7 @@ Tests for the new outline-to-rst CLI command.
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
+from unittest.mock import patch
 
 from rstbuddy.cli.cli import cli
 
@@ -55,6 +56,43 @@ This is a section.
         assert not (temp_dir / "index.rst").exists()
         assert not (temp_dir / "chapter1").exists()
 
+    def test_outline_to_rst_default_output_dir_uses_cli_settings(self, temp_dir):
+        """Test the default output directory comes from the loaded settings."""
+        test_file = temp_dir / "test_outline.md"
+        test_file.write_text(
+            "# Test Book\n\n## Chapter 1: Getting Started\n\nContent.\n",
+            encoding="utf-8",
+        )
+
+        runner = CliRunner()
+        with patch("rstbuddy.services.marko_outline_parser.Settings") as mock_settings:
+            result = runner.invoke(
+                cli, ["outline-to-rst", str(test_file), "--dry-run", "--no-cache"]
+            )
+
+        assert result.exit_code == 0
+        assert "Output directory: doc/source" in result.output
+        mock_settings.assert_not_called()
+
+    def test_outline_to_rst_parses_markdown_once(self, temp_dir):
+        """Test the validator and parser share a single Marko parse."""
+        import marko
+
+        test_file = temp_dir / "test_outline.md"
+        test_file.write_text(
+            "# Test Book\n\n## Chapter 1: Getting Started\n\nContent.\n",
+            encoding="utf-8",
+        )
+
+        runner = CliRunner()
+        with patch("marko.parse", wraps=marko.parse) as mock_parse:
+            result = runner.invoke(
+                cli, ["outline-to-rst", str(test_file), "--dry-run", "--no-cache"]
+            )
+
+        assert result.exit_code == 0
+        mock_parse.assert_called_once()
+
     def test_outline_to_rst_actual_conversion(self, temp_dir):
         """Test that the outline-to-rst command actually converts files."""
         # Create a simple test markdown file
@@ -86,3 +124,33 @@ Section content here.
         assert (output_dir / "chapter1").exists()
         assert (output_dir / "chapter1" / "index.rst").exists()
         assert (output_dir / "chapter1" / "first-section.rst").exists()
+
+    def test_outline_to_rst_pandoc_cache_is_opt_in(self, temp_dir, isolated_cache_home):
+        """Test Pandoc conversions are only cached on disk with --pandoc-cache."""
+        test_file = temp_dir / "test_outline.md"
+        test_file.write_text(
+            "# Test Book\n\n## Chapter 1: Getting Started\n\nContent.\n",
+            encoding="utf-8",
+        )
+        pandoc_cache = isolated_cache_home / "rstbuddy" / "pandoc"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            cli,
+            ["outline-to-rst", str(test_file), "--output-dir", str(temp_dir / "a")],
+        )
+        assert result.exit_code == 0
+        assert not pandoc_cache.exists()
+
+        result = runner.invoke(
+            cli,
+            [
+                "outline-to-rst",
+                str(test_file),
+                "--output-dir",
+                str(temp_dir / "b"),
+                "--pandoc-cache",
+            ],
+        )
+        assert result.exit_code == 0
+        assert any(pandoc_cache.iterdir())
@@ -5,13 +5,19 @@ This module tests the core functionality of the new Marko-based outline-to-rst
 command, focusing on the main use cases that are production-ready.
 """
 
+import os
+import pickle
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from rstbuddy.services.marko_outline_parser import MarkoOutlineParser
 from rstbuddy.services.marko_outline_converter import MarkoOutlineConverter
-from rstbuddy.services.outline_validator import OutlineValidator
+from rstbuddy.services.outline_validator import (
+    OutlineValidator,
+    validate_file_cached,
+)
 from rstbuddy.models.marko_outline import (
     MarkoBookOutline,
     MarkoChapter,
@@ -20,6 +26,7 @@ from rstbuddy.models.marko_outline import (
     MarkoHeadingType,
 )
 from rstbuddy.cli import cli
+from rstbuddy.cli.outline_to_rst import _load_cached_outline, _store_cached_outline
 
 
 class TestMarkoOutlineParser:
@@ -63,6 +70,7 @@ Advanced setup content.
         assert outline.chapters[1].title == "Chapter 2: Advanced Topics"
         assert len(outline.chapters[0].sections) == 2
         assert len(outline.chapters[1].sections) == 1
+        assert outline.total_sections == 3
 
     def test_parse_chapter_with_no_sections(self, tmp_path):
         """Test parsing a chapter with no numbered sections."""
@@ -114,6 +122,95 @@ Content here.
         assert len(outline.chapters[0].sections) == 2
         assert outline.chapters[0].sections[0].number == "1.1"
 
+    def test_heading_text_with_nested_inline_markup(self, tmp_path):
+        """Test heading text is extracted from arbitrarily nested markup."""
+        md_content = """# A *Test* Book
+
+## Chapter 1: Using `rstbuddy`
+
+### 1.1 The **[*linked*](https://example.com) part**
+
+Content here.
+"""
+        md_file = tmp_path / "test.md"
+        md_file.write_text(md_content)
+
+        parser = MarkoOutlineParser()
+        outline = parser.parse_file(md_file, tmp_path / "output")
+
+        assert outline.title == "A Test Book"
+        assert outline.chapters[0].title == "Chapter 1: Using rstbuddy"
+        assert outline.chapters[0].sections[0].title == "The linked part"
+
+    def test_content_blocks_render_lazily(self, tmp_path):
+        """Test content is rendered on first access and survives pickling."""
+        md_content = """# Test Book
+
+## Chapter 1: Introduction
+
+Some *chapter* content.
+"""
+        with patch(
+            "rstbuddy.models.marko_outline._render_markdown", return_value="rendered"
+        ) as render:
+            parser = MarkoOutlineParser()
+            outline = parser.parse_text(md_content, tmp_path / "output")
+            assert render.call_count == 0
+
+            block = outline.chapters[0].content
+            assert block.content == "rendered"
+            assert block.content == "rendered"
+            assert render.call_count == 1
+
+        restored = pickle.loads(pickle.dumps(outline))
+        assert restored.chapters[0].content.content == "rendered"
+
+    def test_content_blocks_compare_by_content(self):
+        """Test blocks compare by their markdown, rendered or not."""
+        import marko
+
+        def block(text):
+            return MarkoContentBlock(None, 1, 2, elements=marko.parse(text).children)
+
+        hello = block("hello")
+        assert hello != block("different")
+        assert hello == block("hello")
+        assert hello == MarkoContentBlock("hello\n", 1, 2)
+        assert hello != MarkoContentBlock("hello\n", 1, 3)
+
+        # Rendering one side doesn't change the result
+        assert hello.content == "hello\n"
+        assert hello != block("different")
+        assert hello == block("hello")
+
+    def test_actual_sections_follow_sections(self):
+        """Test sections added after construction are listed as actual sections."""
+        chapter = MarkoChapter(
+            title="Chapter 1: Test",
+            heading_type=MarkoHeadingType.CHAPTER,
+            folder_name="chapter1",
+            content=MarkoContentBlock("", 1, 1),
+            sections=[],
+        )
+        numbered = MarkoSection(
+            title="Install",
+            number="1.1",
+            content=MarkoContentBlock("", 1, 1),
+            filename="install.rst",
+            section_type="numbered",
+        )
+        content_heading = MarkoSection(
+            title="Summary",
+            number="",
+            content=MarkoContentBlock("", 1, 1),
+            filename="",
+            section_type="content",
+        )
+
+        chapter.sections.extend([numbered, content_heading])
+
+        assert chapter.actual_sections == [numbered]
+
 
 class TestMarkoOutlineConverter:
     """Test the Marko-based outline converter core functionality."""
@@ -182,6 +279,88 @@ class TestMarkoOutlineConverter:
         captured = capsys.readouterr()
         assert "DRY RUN" in captured.out
 
+    def test_show_generated_structure(self, tmp_path, capsys):
+        """Test the generated structure tree is printed in order."""
+        outline = MarkoBookOutline(
+            title="Test Book",
+            introduction_content=MarkoContentBlock("", 1, 1),
+            chapters=[
+                MarkoChapter(
+                    title="Chapter 1: Test",
+                    heading_type=MarkoHeadingType.CHAPTER,
+                    folder_name="chapter1",
+                    content=MarkoContentBlock("", 1, 1),
+                    sections=[
+                        MarkoSection(
+                            title="Install",
+                            number="1.1",
+                            content=MarkoContentBlock("", 1, 1),
+                            filename="install.rst",
+                            section_type="numbered",
+                        ),
+                        MarkoSection(
+                            title="Configure",
+                            number="1.2",
+                            content=MarkoContentBlock("", 1, 1),
+                            filename="configure.rst",
+                            section_type="numbered",
+                        ),
+                    ],
+                )
+            ],
+            output_dir=tmp_path / "output",
+        )
+
+        MarkoOutlineConverter().show_generated_structure(outline)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "└── output/",
+            "    ├── chapter1/",
+            "    │   ├── install.rst",
+            "    │   └── configure.rst",
+            "    │   └── index.rst",
+            "    └── index.rst",
+        ]
+
+    def test_convert_outline_logs_files_in_order(self, tmp_path, capsys):
+        """Test each written file is reported on its own line, in order."""
+        output_dir = tmp_path / "output"
+        outline = MarkoBookOutline(
+            title="Test Book",
+            introduction_content=MarkoContentBlock("", 1, 1),
+            chapters=[
+                MarkoChapter(
+                    title=f"Chapter {number}: Test",
+                    heading_type=MarkoHeadingType.CHAPTER,
+                    folder_name=f"chapter{number}",
+                    content=MarkoContentBlock("", 1, 1),
+                    sections=[
+                        MarkoSection(
+                            title=f"Section {number}.{i}",
+                            number=f"{number}.{i}",
+                            content=MarkoContentBlock("", 1, 1),
+                            filename=f"section-{i}.rst",
+                            section_type="numbered",
+                        )
+                        for i in range(1, 4)
+                    ],
+                )
+                for number in range(1, 4)
+            ],
+            output_dir=output_dir,
+        )
+
+        MarkoOutlineConverter().convert_outline(outline)
+
+        expected = [f"Updated: {output_dir / 'index.rst'}"]
+        for number in range(1, 4):
+            chapter_dir = output_dir / f"chapter{number}"
+            expected.append(f"Updated: {chapter_dir / 'index.rst'}")
+            expected.extend(
+                f"Updated: {chapter_dir / f'section-{i}.rst'}" for i in range(1, 4)
+            )
+        assert capsys.readouterr().out.splitlines() == expected
+
     def test_force_overwrite_with_backup(self, tmp_path):
         """Test that force=True creates backups when overwriting."""
         # Create initial content
@@ -242,6 +421,56 @@ Content here.
         assert result.is_valid
         assert len(result.errors) == 0
 
+    def test_validate_file_cached(self, tmp_path):
+        """Test cached validation is reused until the file changes."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("# Test Book\n\n## Chapter 1: Test\n")
+
+        first = validate_file_cached(md_file)
+        assert first.is_valid
+        assert validate_file_cached(md_file) == first
+
+        md_file.write_text("## Chapter 1: Test\n")
+        assert not validate_file_cached(md_file).is_valid
+
+    def test_validate_file_cached_returns_copies(self, tmp_path):
+        """Test callers cannot change the cached validation result."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("## Chapter 1: Test\n")
+
+        first = validate_file_cached(md_file)
+        first.errors[0].message = "changed"
+        first.errors.clear()
+        first.is_valid = True
+
+        second = validate_file_cached(md_file)
+        assert not second.is_valid
+        assert second.errors
+        assert second.errors[0].message != "changed"
+
+    def test_validate_file_cached_hashes_content(self, tmp_path):
+        """Test supplied text is revalidated even if the file stat matches."""
+        md_file = tmp_path / "test.md"
+        valid = "# Test Book\n\n## Chapter 1: Test\n"
+        invalid = "## Test Book\n\n# Chapter 1: Test\n"
+        md_file.write_text(valid)
+        stat = md_file.stat()
+
+        assert validate_file_cached(md_file, valid).is_valid
+        # Same size, same mtime: only the content hash tells them apart
+        md_file.write_text(invalid)
+        os.utime(md_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert not validate_file_cached(md_file, invalid).is_valid
+
+    def test_validate_text_matches_validate_file(self, tmp_path):
+        """Test validating pre-read text gives the same result as the file."""
+        md_content = "# Test Book\n\n## Chapter 1: Test\n\n### 1.1 Section\n"
+        md_file = tmp_path / "test.md"
+        md_file.write_text(md_content)
+
+        validator = OutlineValidator()
+        assert validator.validate_text(md_content) == validator.validate_file(md_file)
+
     def test_validate_missing_title(self, tmp_path):
         """Test validation of outline missing title."""
         md_content = """## Chapter 1: Introduction
@@ -281,6 +510,26 @@ Content here.
         # Should be valid even with empty chapter
         assert result.is_valid
 
+    def test_validate_deep_section_numbering(self):
+        """Test over-deep numbering is reported with its line, chapters first."""
+        md_content = """# Test Book
+
+## Appendix A: Extras
+
+### A.1.1 Too Deep
+
+## Chapter 1: Basics
+
+### 1.1.1 Too Deep
+"""
+        result = OutlineValidator().validate_text(md_content)
+
+        assert not result.is_valid
+        chapter_error, appendix_error = result.errors[:2]
+        assert (chapter_error.line_number, appendix_error.line_number) == (9, 5)
+        assert "'1.1.1'" in chapter_error.message
+        assert "'A.1.1'" in appendix_error.message
+
 
 class TestIntegration:
     """Integration tests for the complete outline-to-rst workflow."""
@@ -420,6 +669,95 @@ Content here.
         # Verify no files were created in dry-run mode
         assert not output_dir.exists()
 
+    def test_outline_to_rst_dry_run_uses_outline_cache(
+        self, runner, tmp_path, isolated_cache_home
+    ):
+        """Test repeated dry runs reuse the cached outline."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("# Test Book\n\n## Chapter 1: Introduction\n")
+        args = [
+            "outline-to-rst",
+            "--dry-run",
+            "--output-dir",
+            str(tmp_path / "output"),
+            str(md_file),
+        ]
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert len(list((isolated_cache_home / "rstbuddy").glob("*.json"))) == 1
+
+        with patch.object(
+            MarkoOutlineParser,
+            "parse_text",
+            autospec=True,
+            side_effect=MarkoOutlineParser.parse_text,
+        ) as mock_parse_text:
+            result = runner.invoke(cli, args)
+            assert result.exit_code == 0
+            assert "Chapter 1: Introduction" in result.output
+            mock_parse_text.assert_not_called()
+
+            # --no-cache forces parsing again
+            result = runner.invoke(cli, [*args[:1], "--no-cache", *args[1:]])
+            assert result.exit_code == 0
+            assert "Chapter 1: Introduction" in result.output
+            mock_parse_text.assert_called_once()
+
+    def test_outline_cache_is_keyed_on_package_version(
+        self, runner, tmp_path, isolated_cache_home
+    ):
+        """Test an outline cached by another release of rstbuddy isn't reused."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text("# Test Book\n\n## Chapter 1: Introduction\n")
+        args = [
+            "outline-to-rst",
+            "--dry-run",
+            "--output-dir",
+            str(tmp_path / "output"),
+            str(md_file),
+        ]
+
+        with patch("rstbuddy.cli.outline_to_rst.__version__", "0.0.1"):
+            result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "using cached outline" not in result.output
+        assert len(list((isolated_cache_home / "rstbuddy").glob("*.json"))) == 2
+
+    def test_outline_cache_round_trip(self, tmp_path):
+        """Test a cached outline loads back equal to the one stored."""
+        md_file = tmp_path / "test.md"
+        md_file.write_text(
+            "# Test Book\n\nIntro.\n\n## Chapter 1: Introduction\n\n"
+            "### 1.1 Setup\n\nContent.\n\n## Appendix A: Extras\n"
+        )
+        validation_result = validate_file_cached(md_file)
+        outline = MarkoOutlineParser().parse_file(md_file, tmp_path / "output")
+        cache_path = tmp_path / "entry.json"
+
+        _store_cached_outline(cache_path, validation_result, outline)
+
+        assert _load_cached_outline(cache_path) == (validation_result, outline)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"\x80\x04not json",
+            b"[1, 2, 3]",
+            b'{"validation_result": {}, "outline": {}}',
+        ],
+    )
+    def test_outline_cache_discards_bad_entries(self, tmp_path, data):
+        """Test an unreadable cache entry is a miss and is deleted."""
+        cache_path = tmp_path / "entry.json"
+        cache_path.write_bytes(data)
+
+        assert _load_cached_outline(cache_path) is None
+        assert not cache_path.exists()
+
     def test_outline_to_rst_actual_conversion(self, runner, tmp_path):
         """Test outline-to-rst command with actual conversion."""
         # Create a simple test markdown file
@@ -33,6 +33,20 @@ def mock_robot_parser_instance(mock_robotparser):
 class TestRSTLinkCheckerExtended:
     """Extended tests for RSTLinkChecker to cover missing lines."""
 
+    def test_scan_rst_files_recurses_and_sorts(self, tmp_path):
+        """Test scan_rst_files finds nested .rst files in sorted order."""
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "nested.rst").write_text("", encoding="utf-8")
+        (tmp_path / "a.rst").write_text("", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("", encoding="utf-8")
+
+        checker = RSTLinkChecker(tmp_path)
+
+        assert checker.scan_rst_files() == [
+            tmp_path / "a.rst",
+            tmp_path / "b" / "nested.rst",
+        ]
+
     def test_build_label_index_with_os_error(self, tmp_path):
         """Test build_label_index handles OSError gracefully."""
         checker = RSTLinkChecker(tmp_path)
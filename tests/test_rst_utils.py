@@ -0,0 +1,284 @@
+"""
+Tests for the RST utility functions used by outline-to-rst.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+import subprocess
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from rstbuddy.exc import FileError
+from rstbuddy.services.rst_utils import (
+    backup_and_write_file,
+    content_is_different,
+    convert_content_to_rst,
+    convert_contents_to_rst,
+    normalize_content,
+    pandoc_cache_dir,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class TestConvertContentsToRst:
+    """Test batch Markdown to RST conversion."""
+
+    def test_batch_matches_single_conversions(self):
+        """Test batch results are identical to converting each block alone."""
+        contents = [
+            "# Summary\n\nFirst block with a footnote[^1].\n\n[^1]: The note.\n",
+            "# Summary\n\nSecond block with [a link](https://example.com).\n",
+            "- one\n- two\n\n```python\nprint('hi')\n```\n",
+        ]
+        cache: dict[str, str] = {}
+
+        convert_contents_to_rst(contents, cache)
+
+        assert set(cache) == set(contents)
+        for content in contents:
+            assert cache[content] == convert_content_to_rst(content)
+
+    def test_batch_uses_one_pandoc_process(self):
+        """Test all blocks are converted by a single subprocess call."""
+        cache: dict[str, str] = {}
+        with patch(
+            "rstbuddy.services.rst_utils.subprocess.run", wraps=subprocess.run
+        ) as mock_run:
+            convert_contents_to_rst(["one", "two", "three", "two", "  "], cache)
+        assert mock_run.call_count == 1
+        assert set(cache) == {"one", "two", "three"}
+
+    def test_batch_uses_persistent_cache(self):
+        """Test a later batch takes previously converted blocks from disk."""
+        contents = ["one", "two *emphasis*"]
+        first: dict[str, str] = {}
+        convert_contents_to_rst(contents, first, persistent_cache=True)
+
+        second: dict[str, str] = {}
+        with patch("rstbuddy.services.rst_utils.subprocess.run") as mock_run:
+            convert_contents_to_rst(contents, second, persistent_cache=True)
+        mock_run.assert_not_called()
+        assert second == first
+
+    def test_batch_skips_persistent_cache_by_default(self):
+        """Test nothing is written to disk unless the caller opts in."""
+        convert_contents_to_rst(["one"], {})
+        assert not pandoc_cache_dir().exists()
+
+    def test_batch_failure_falls_back_to_single_conversions(self):
+        """Test blocks are converted one by one if ``pandoc lua`` fails."""
+        run = subprocess.run
+
+        def no_lua(args, **kwargs):
+            if args[:2] == ["pandoc", "lua"]:
+                raise subprocess.CalledProcessError(2, args)
+            return run(args, **kwargs)
+
+        cache: dict[str, str] = {}
+        with patch(
+            "rstbuddy.services.rst_utils.subprocess.run", side_effect=no_lua
+        ) as mock_run:
+            convert_contents_to_rst(["one", "two", "three"], cache)
+        assert mock_run.call_count == 4
+        assert cache == {
+            content: convert_content_to_rst(content)
+            for content in ("one", "two", "three")
+        }
+
+    def test_batch_failure_leaves_cache_empty(self):
+        """Test a failing pandoc leaves conversion to convert_content_to_rst."""
+        cache: dict[str, str] = {}
+        with patch(
+            "rstbuddy.services.rst_utils.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "pandoc"),
+        ):
+            convert_contents_to_rst(["one"], cache)
+        assert cache == {}
+
+
+class TestConvertContentToRst:
+    """Test single-block Markdown to RST conversion."""
+
+    def test_conversion_uses_pipes(self):
+        """Test content is piped through pandoc without temporary files."""
+        with patch(
+            "rstbuddy.services.rst_utils.subprocess.run", wraps=subprocess.run
+        ) as mock_run:
+            rst = convert_content_to_rst("Some *text*.\n")
+        assert rst.strip() == "Some *text*."
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["pandoc", "-f", "markdown", "-t", "rst"]
+        assert kwargs["input"] == "Some *text*.\n"
+
+    def test_failure_includes_pandoc_stderr(self):
+        """Test pandoc's error output is included in the raised FileError."""
+        error = subprocess.CalledProcessError(
+            64, "pandoc", stderr="Unknown option --bogus\n"
+        )
+        with (
+            patch("rstbuddy.services.rst_utils.subprocess.run", side_effect=error),
+            pytest.raises(FileError, match="Unknown option --bogus"),
+        ):
+            convert_content_to_rst("text")
+
+    def test_persistent_cache_round_trip(self):
+        """Test a conversion saved to disk is reused without running pandoc."""
+        rst = convert_content_to_rst("Some *text*.\n", persistent_cache=True)
+        with patch("rstbuddy.services.rst_utils.subprocess.run") as mock_run:
+            cached = convert_content_to_rst("Some *text*.\n", persistent_cache=True)
+        mock_run.assert_not_called()
+        assert cached == rst
+
+
+class TestBackupAndWriteFile:
+    """Test writing generated RST files."""
+
+    def test_write_replaces_longer_content(self, tmp_path):
+        """Test rewriting a file truncates its previous, longer content."""
+        path = tmp_path / "nested" / "index.rst"
+        backup_and_write_file(path, "A much longer first version\n" * 10)
+        backup_and_write_file(path, "Short\n")
+        assert path.read_text(encoding="utf-8") == "Short\n"
+
+    def test_write_encodes_utf8(self, tmp_path):
+        """Test non-ASCII content is written as UTF-8."""
+        path = tmp_path / "index.rst"
+        backup_and_write_file(path, "Caf\u00e9 \u2014 \u6f22\n")
+        assert path.read_bytes() == "Caf\u00e9 \u2014 \u6f22\n".encode()
+
+    def test_failed_write_keeps_existing_file(self, tmp_path):
+        """Test a write that fails leaves the old file and no temporary file."""
+        path = tmp_path / "index.rst"
+        backup_and_write_file(path, "Original\n")
+        with (
+            patch("rstbuddy.services.rst_utils.os.write", side_effect=OSError),
+            pytest.raises(OSError),
+        ):
+            backup_and_write_file(path, "Replacement\n")
+        assert path.read_text(encoding="utf-8") == "Original\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["index.rst"]
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions")
+    def test_write_keeps_file_mode(self, tmp_path):
+        """Test rewriting a file keeps its permissions."""
+        path = tmp_path / "index.rst"
+        path.write_text("Old\n", encoding="utf-8")
+        path.chmod(0o640)
+        backup_and_write_file(path, "New\n")
+        assert path.read_text(encoding="utf-8") == "New\n"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640  # noqa: PLR2004
+
+    def test_write_goes_through_symlinks(self, tmp_path):
+        """Test writing to a symlink replaces its target, not the link."""
+        target = tmp_path / "real.rst"
+        target.write_text("Old\n", encoding="utf-8")
+        link = tmp_path / "index.rst"
+        link.symlink_to(target)
+        backup_and_write_file(link, "New\n")
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "New\n"
+
+    def test_written_hashes_skip_reading_back(self, tmp_path):
+        """Test a path written before is compared by digest, not read again."""
+        path = tmp_path / "index.rst"
+        written_hashes: dict[Path, bytes] = {}
+        backup_and_write_file(path, "Title  \n", written_hashes=written_hashes)
+        assert path in written_hashes
+        with patch.object(type(path), "open") as mock_open:
+            assert not content_is_different(path, "Title\n", written_hashes)
+            assert content_is_different(path, "Other\n", written_hashes)
+        mock_open.assert_not_called()
+
+    def test_backups_share_the_given_timestamp(self, tmp_path):
+        """Test every backup made with one timestamp is named with it."""
+        paths = [tmp_path / "index.rst", tmp_path / "intro.rst"]
+        for path in paths:
+            path.write_text("Old\n", encoding="utf-8")
+            backup_and_write_file(
+                path, "New\n", force=True, backup_timestamp="20240101_000000"
+            )
+        assert sorted(p.name for p in tmp_path.glob("*.bak")) == [
+            "index.20240101_000000.bak",
+            "intro.20240101_000000.bak",
+        ]
+
+    def test_backup_keeps_old_content(self, tmp_path):
+        """Test the backup still holds the old content after the write."""
+        path = tmp_path / "index.rst"
+        path.write_text("Old\n", encoding="utf-8")
+        backup_and_write_file(
+            path, "New\n", force=True, backup_timestamp="20240101_000000"
+        )
+        backup_path = tmp_path / "index.20240101_000000.bak"
+        assert backup_path.read_text(encoding="utf-8") == "Old\n"
+        assert path.read_text(encoding="utf-8") == "New\n"
+
+    def test_backup_falls_back_to_copy(self, tmp_path):
+        """Test files are copied if they can't be hard linked."""
+        path = tmp_path / "index.rst"
+        path.write_text("Old\n", encoding="utf-8")
+        with patch("rstbuddy.services.rst_utils.os.link", side_effect=OSError):
+            backup_and_write_file(
+                path, "New\n", force=True, backup_timestamp="20240101_000000"
+            )
+        backup_path = tmp_path / "index.20240101_000000.bak"
+        assert backup_path.read_text(encoding="utf-8") == "Old\n"
+
+
+class TestContentIsDifferent:
+    """Test comparing new content against an existing file."""
+
+    def test_missing_file_is_different(self, tmp_path):
+        """Test a file that doesn't exist counts as different."""
+        assert content_is_different(tmp_path / "missing.rst", "Title\n")
+
+    def test_trailing_whitespace_is_ignored(self, tmp_path):
+        """Test content differing only in trailing whitespace is the same."""
+        path = tmp_path / "index.rst"
+        path.write_bytes(b"Title   \r\n=====\r\n\r\nBody\t\r\n")
+        assert not content_is_different(path, "Title\n=====\n\nBody")
+
+    def test_smaller_file_is_different_without_reading(self, tmp_path):
+        """Test a file shorter than the new content is not read."""
+        path = tmp_path / "index.rst"
+        path.write_text("Title\n", encoding="utf-8")
+        with patch.object(type(path), "open") as mock_open:
+            assert content_is_different(path, "Title\n=====\n\nBody\n")
+        mock_open.assert_not_called()
+
+    def test_identical_bytes_are_not_decoded(self, tmp_path):
+        """Test a file holding exactly the new content is compared as bytes."""
+        path = tmp_path / "index.rst"
+        backup_and_write_file(path, "Caf\u00e9\n")
+        with patch(
+            "rstbuddy.services.rst_utils.normalize_content",
+            wraps=normalize_content,
+        ) as mock_normalize:
+            assert not content_is_different(path, "Caf\u00e9\n")
+        mock_normalize.assert_called_once_with("Caf\u00e9\n")
+
+    def test_same_size_invalid_utf8_is_different(self, tmp_path):
+        """Test an undecodable file the same size as the content differs."""
+        path = tmp_path / "index.rst"
+        path.write_bytes(b"Caf\xff\n")
+        assert content_is_different(path, "Cafe\n")
+
+    def test_line_boundaries_match_normalize_content(self, tmp_path):
+        """Test boundaries file iteration doesn't split on are still honored."""
+        path = tmp_path / "index.rst"
+        path.write_text("Title \x0cBody\n", encoding="utf-8")
+        assert not content_is_different(path, "Title\nBody")
+        assert content_is_different(path, "Title \x0cBody!")
+
+    def test_empty_file_matches_blank_content(self, tmp_path):
+        """Test an empty file matches content that normalizes to nothing."""
+        path = tmp_path / "index.rst"
+        path.write_text("", encoding="utf-8")
+        assert not content_is_different(path, "   \n")
+        assert content_is_different(path, "\n\n")